@@ -0,0 +1 @@
+"""Mesures de performance hors jeu (SDL_VIDEODRIVER=dummy)."""
@@ -0,0 +1,4 @@
+import sys
+from bench.suite import main
+
+sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark : ombres et dégradés des bâtiments de CastleView,
+dessin ligne par ligne (ancienne méthode) contre cache de surfaces.
+    python -m bench.building_surfaces
+"""
+import os, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from game import castle_view
+
+REPEAT = 200
+SIZES = [(130, 90), (140, 100), (170, 120), (175, 120), (200, 140), (160, 112)]  # bâtiments du village
+COLORS = ((210, 180, 140), (160, 130, 90))
+
+
+def _shadow_rows(w, h):
+    shadow = pygame.Surface((w, h), pygame.SRCALPHA)
+    for i in range(h):
+        alpha = int(120 * (1 - i / h))
+        pygame.draw.ellipse(shadow, (0, 0, 0, alpha), (0, i, w, 1))
+    return shadow
+
+
+def _gradient_rows(surf, rect, base_color, dark_color):
+    for i in range(rect.height):
+        k = i / rect.height
+        c = (
+            int(base_color[0] * (1 - k) + dark_color[0] * k),
+            int(base_color[1] * (1 - k) + dark_color[1] * k),
+            int(base_color[2] * (1 - k) + dark_color[2] * k)
+        )
+        pygame.draw.line(surf, c, (rect.left, rect.top + i), (rect.right, rect.top + i))
+
+
+def _time(fn) -> float:
+    t = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - t) / REPEAT * 1e6
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+    rects = [pygame.Rect(20, 20, w, h) for w, h in SIZES]
+    shadows = [(w + int(w * 0.12), int(h * 0.25) + int(h * 0.18)) for w, h in SIZES]
+
+    def old_frame():
+        for r in rects:
+            _gradient_rows(screen, r, *COLORS)
+        for w, h in shadows:
+            screen.blit(_shadow_rows(w, h), (0, 0))
+
+    def new_frame():
+        for r in rects:
+            screen.blit(castle_view._gradient_surface(r.width + 1, r.height, *COLORS), r.topleft)
+        for w, h in shadows:
+            screen.blit(castle_view._shadow_surface(w, h), (0, 0))
+
+    # mêmes pixels avant de comparer les temps
+    a, b = pygame.Surface((640, 480)), pygame.Surface((640, 480))
+    _gradient_rows(a, rects[0], *COLORS); a.blit(_shadow_rows(*shadows[0]), (300, 300))
+    b.blit(castle_view._gradient_surface(rects[0].width + 1, rects[0].height, *COLORS), rects[0].topleft)
+    b.blit(castle_view._shadow_surface(*shadows[0]), (300, 300))
+    same = pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+    old_us, new_us = _time(old_frame), _time(new_frame)
+    print(f"identique      : {same}")
+    print(f"ligne par ligne: {old_us:8.1f} µs / frame")
+    print(f"cache          : {new_us:8.1f} µs / frame  (x{old_us / new_us:.1f})")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
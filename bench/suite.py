@@ -0,0 +1,205 @@
+"""
+Suite de benchmarks hors écran (SDL_VIDEODRIVER=dummy).
+    python -m bench                       # tout, résultats dans bench_results.json
+    python -m bench --frames 300 --only frames
+    python -m bench --save-baseline       # fige la référence (bench/baseline.json)
+    python -m bench --threshold 0.25      # échec (code 1) si un p95 dépasse la référence de +25 %
+    python -m bench --replay session.krpl # + temps de frame d'une session enregistrée (main.py --record)
+Mesures : étapes de génération du monde, update/draw par scène, hit-test sur 10 / 1k / 10k châteaux.
+Chaque entrée donne mean, p95, p99 (ms) et le nombre d'échantillons ; la comparaison à la référence
+ignore les entrées de moins de MIN_SAMPLES échantillons (--world-runs règle celui des étapes du monde).
+"""
+import argparse, json, os, random, sys, tempfile, time
+from pathlib import Path
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_OUT = ROOT / "bench_results.json"
+FRAMES = 120
+WORLD_RUNS = 5       # générations du monde mesurées
+MIN_SAMPLES = 5      # en dessous, une entrée est affichée mais exclue de la comparaison
+HIT_SIZES = (10, 1_000, 10_000)
+HIT_QUERIES = 2_000
+THRESHOLD = 0.20  # régression tolérée sur p95
+
+
+def _time_ms(fn) -> float:
+    t = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t) * 1000.0
+
+
+# ---------- génération du monde ----------
+def bench_world(results: dict, data_dir: Path, runs: int):
+    """`runs` générations à froid (dossier neuf : ni sauvegarde ni cache terrain) ; renvoie la dernière."""
+    from game.scene import SceneManager
+    from game import world_map
+    from game.profiler import summarize
+
+    samples: dict[str, list[float]] = {}
+    for r in range(runs):
+        world_map.DATA_DIR = data_dir / f"run{r}"
+        mgr = SceneManager()
+        samples.setdefault("world/construct", []).append(_time_ms(lambda: world_map.WorldMap(mgr)))
+        world = world_map.WorldMap(mgr)
+        t = time.perf_counter()
+        stage = None
+        for name, _ in world.iter_generation():
+            now = time.perf_counter()
+            if stage is not None:
+                samples.setdefault(f"world/stage/{stage}", []).append((now - t) * 1000.0)
+            stage, t = name, now
+        samples.setdefault(f"world/stage/{stage}", []).append((time.perf_counter() - t) * 1000.0)
+    for key, s in samples.items():
+        results[key] = summarize(s)
+    return mgr, world
+
+
+# ---------- frames par scène ----------
+def bench_frames(results: dict, mgr, world, frames: int):
+    from game.castle_view import CastleView
+    from game.shop_view import ShopView
+    from game.barracks_view import BarracksView
+    from game.battle_view import BattleView
+    from game.profiler import summarize
+
+    screen = pygame.display.get_surface()
+    castle = world.castles[0]
+    scenes = {
+        "WorldMap": world,
+        "CastleView": CastleView(mgr, castle),
+        "ShopView": ShopView(mgr, castle),
+        "BarracksView": BarracksView(mgr, castle),
+        "BattleView": BattleView(mgr),
+    }
+    # le roi traverse la carte (défilement + tuiles à générer), sans combat ni entrée au château
+    random.seed(0)
+    world.selected = None
+    world._event_chance, chance = 0.0, world._event_chance
+    world._route_king(world.king.pos.x + 600, world.king.pos.y + 200)
+    dt = 1.0 / 60
+    for name, scene in scenes.items():
+        upd, drw, full = [], [], []
+        for _ in range(frames):
+            upd.append(_time_ms(lambda: scene.update(dt)))
+            drw.append(_time_ms(lambda: scene.draw(screen)))
+        for _ in range(frames):  # repeinture complète (entrée dans la scène, fenêtre exposée)
+            scene.invalidate()
+            full.append(_time_ms(lambda: scene.draw(screen)))
+        results[f"frame/{name}/update"] = summarize(upd)
+        results[f"frame/{name}/draw"] = summarize(drw)
+        results[f"frame/{name}/draw_full"] = summarize(full)
+    world._event_chance = chance
+
+
+# ---------- hit-test ----------
+def bench_hit_test(results: dict, world):
+    from game.entities import Castle
+    from game.spatial import SpatialGrid
+    from game.profiler import summarize
+    from settings import WORLD_W, WORLD_H
+
+    rng = random.Random(7)
+    castles, index = world.castles, world.castle_index
+    try:
+        for n in HIT_SIZES:
+            world.castles, world.castle_index = [], SpatialGrid()
+            for i in range(n):
+                world._add_castle(Castle(f"C{i}", rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H)))
+            pts = [(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H)) for _ in range(HIT_QUERIES)]
+            samples = []
+            for x, y in pts:
+                t = time.perf_counter()
+                world.castle_at(x, y)
+                samples.append((time.perf_counter() - t) * 1000.0)
+            results[f"hit_test/castle_at/{n}"] = summarize(samples)
+    finally:
+        world.castles, world.castle_index = castles, index
+
+
+# ---------- session rejouée ----------
+def bench_replay(results: dict, path: Path):
+    from game import replay
+
+    res = replay.play(path, pygame.display.get_surface())
+    if res["diverged"]:
+        print(f"attention : rejeu divergent dès la frame {res['diverged'][0][0]} ({path})")
+    for key in ("frame", "update", "draw"):
+        results[f"replay/{key}"] = res[key]
+
+
+# ---------- référence ----------
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Entrées dont le p95 dépasse la référence de plus de `threshold` (fraction)."""
+    regressions = []
+    for key, ref in baseline.items():
+        cur = results.get(key)
+        if cur is None or ref["p95"] <= 0 or min(cur["n"], ref.get("n", 0)) < MIN_SAMPLES:
+            continue  # un p95 sur trop peu d'échantillons ne mesure que du bruit
+        ratio = cur["p95"] / ref["p95"]
+        if ratio > 1.0 + threshold:
+            regressions.append(f"{key}: p95 {ref['p95']:.3f} -> {cur['p95']:.3f} ms (x{ratio:.2f})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m bench", description=__doc__.splitlines()[1])
+    ap.add_argument("--frames", type=int, default=FRAMES, help="frames mesurées par scène")
+    ap.add_argument("--world-runs", type=int, default=WORLD_RUNS, help="générations du monde mesurées")
+    ap.add_argument("--only", choices=("world", "frames", "hit_test", "replay"), action="append",
+                    help="ne lancer que ces groupes (répétable)")
+    ap.add_argument("--replay", type=Path, help="enregistrement à rejouer (groupe replay)")
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT, help="fichier JSON des résultats")
+    ap.add_argument("--baseline", type=Path, default=BASELINE)
+    ap.add_argument("--save-baseline", action="store_true", help="écrire les résultats comme référence")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = ap.parse_args(argv)
+    groups = set(args.only or ("world", "frames", "hit_test", *(("replay",) if args.replay else ())))
+
+    sys.path.insert(0, str(ROOT))
+    pygame.init()
+    from settings import WIDTH, HEIGHT
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    from game import world_map
+    from game.save import SAVES
+    data_dir = world_map.DATA_DIR
+    results: dict[str, dict] = {}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            runs = args.world_runs if "world" in groups else 1
+            mgr, world = bench_world(results, Path(tmp), runs)  # le monde sert aussi aux autres groupes
+            if "world" not in groups:
+                results.clear()
+            if "frames" in groups:
+                bench_frames(results, mgr, world, args.frames)
+            if "hit_test" in groups:
+                bench_hit_test(results, world)
+            if "replay" in groups:
+                if args.replay is None:
+                    ap.error("--only replay demande --replay FICHIER")
+                bench_replay(results, args.replay)
+            SAVES.flush()  # sauvegardes des premiers runs écrites avant la suppression du dossier
+    finally:
+        world_map.DATA_DIR = data_dir
+    pygame.quit()
+
+    width = max(len(k) for k in results)
+    print(f"{'':{width}}  {'mean':>9} {'p95':>9} {'p99':>9} {'n':>6}   (ms ; * hors comparaison, n < {MIN_SAMPLES})")
+    for key, r in results.items():
+        mark = "*" if r["n"] < MIN_SAMPLES else ""
+        print(f"{key:{width}}  {r['mean']:9.3f} {r['p95']:9.3f} {r['p99']:9.3f} {r['n']:6d}{mark}")
+    args.out.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"référence écrite : {args.baseline}")
+        return 0
+    if args.baseline.exists():
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        for line in regressions:
+            print("RÉGRESSION", line)
+        return 1 if regressions else 0
+    return 0
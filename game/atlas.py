@@ -0,0 +1,58 @@
+"""
+Atlas de sprites : variantes d'entités rendues une fois dans de grandes pages SRCALPHA
+(rangement en étagères), au format écran dès qu'une fenêtre existe.
+Chaque variante est rendue à la première demande de sa clé : un changement de propriétaire
+ne rend que la nouvelle variante, les autres restent en place.
+"""
+import pygame
+
+PAGE_SIZE = 512  # px par côté de page
+PAD = 1          # marge entre sprites (pas de fuite au filtrage)
+
+
+class SpriteAtlas:
+    def __init__(self, page_size: int = PAGE_SIZE):
+        self.page_size = page_size
+        self.pages: list[pygame.Surface] = []
+        self._sprites: dict = {}  # clé -> (sous-surface, ancre)
+        self._shelf = (0, 0, 0)   # (x, y, hauteur) de l'étagère courante de la dernière page
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def __contains__(self, key) -> bool:
+        return key in self._sprites
+
+    def _new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._shelf = (0, 0, 0)
+
+    def _alloc(self, w: int, h: int) -> pygame.Surface:
+        if w + PAD > self.page_size or h + PAD > self.page_size:
+            return pygame.Surface((w, h), pygame.SRCALPHA)  # trop grand : hors atlas
+        if not self.pages:
+            self._new_page()
+        x, y, sh = self._shelf
+        if x + w + PAD > self.page_size:  # étagère pleine -> suivante
+            x, y, sh = 0, y + sh, 0
+        if y + h + PAD > self.page_size:
+            self._new_page()
+            x, y, sh = self._shelf
+        self._shelf = (x + w + PAD, y, max(sh, h + PAD))
+        return self.pages[-1].subsurface((x, y, w, h))
+
+    def get(self, key, size: tuple[int, int], anchor: tuple[int, int], paint) -> tuple[pygame.Surface, tuple[int, int]]:
+        """(surface, ancre) de la variante `key`, peinte par paint(surf, ancre) au premier appel."""
+        spr = self._sprites.get(key)
+        if spr is None:
+            surf = self._alloc(*size)
+            paint(surf, pygame.Vector2(anchor))
+            spr = self._sprites[key] = (surf, anchor)
+        return spr
+
+
+ATLAS = SpriteAtlas()
@@ -1,10 +1,9 @@
+import itertools
 import pygame
 from settings import WIDTH, HEIGHT, COLOR_UI
 from .scene import Scene
-from .entities import SOLDIERS
-
-def _font(sz:int)->pygame.font.Font:
-    return pygame.font.Font(None, sz)
+from . import text
+from .entities import SOLDIERS, catalog_icon, catalog_visible
 
 class BarracksView(Scene):
     """
@@ -17,11 +16,10 @@ class BarracksView(Scene):
         super().__init__(mgr)
         self.castle = castle
         self.king = mgr.game_state.king
-        self.font_big = _font(36)
-        self.font = _font(24)
         self.t = 0.0
         self.icon_size = 40
         self.spacing = 60
+        self._drawn = None  # état affiché : écran statique tant qu'il ne change pas
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -45,39 +43,43 @@ class BarracksView(Scene):
                         pass  # Congé déjà géré dans dismiss_soldier
                     return
 
+    @property
+    def animating(self) -> bool:
+        return False  # écran fixe entre deux clics
+
     def update(self, dt: float):
         self.t += dt
 
     def draw(self, surface: pygame.Surface):
+        state = (self.king.resources["gold"], self.king.resources["food"], tuple(self.king.army.items()))
+        if not self._redraw and state == self._drawn:
+            return []
+        self._redraw, self._drawn = False, state
         surface.fill((32, 28, 24))
-        title = self.font_big.render(f"Caserne — {self.castle.name}", True, COLOR_UI)
+        title = text.render(f"Caserne — {self.castle.name}", 36, COLOR_UI)
         surface.blit(title, (WIDTH//2 - title.get_width()//2, 40))
 
         # Ressources du roi
-        res_text = self.font.render(f"Or: {self.king.resources['gold']} | Nourriture: {self.king.resources['food']}", True, COLOR_UI)
+        res_text = text.render(f"Or: {self.king.resources['gold']} | Nourriture: {self.king.resources['food']}", 24, COLOR_UI)
         surface.blit(res_text, (50, 80))
 
         # Ligne haut : Troupes à recruter
-        recruit_text = self.font.render("À recruter (cliquez sur l'icône) :", True, COLOR_UI)
+        recruit_text = text.render("À recruter (cliquez sur l'icône) :", 24, COLOR_UI)
         surface.blit(recruit_text, (50, 100))
-        for i, soldier_type in enumerate(SOLDIERS):
+        for i, soldier_type in enumerate(itertools.islice(SOLDIERS, catalog_visible(self.spacing))):
             soldier = SOLDIERS[soldier_type]
-            icon_surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
-            soldier["icon_func"](icon_surf, (self.icon_size//2, self.icon_size//2))
-            surface.blit(icon_surf, (50 + i * self.spacing, 120))
-            cost_text = self.font.render(f"{soldier['cost_gold']} or", True, COLOR_UI)
+            surface.blit(catalog_icon(SOLDIERS, soldier_type, self.icon_size), (50 + i * self.spacing, 120))
+            cost_text = text.render(f"{soldier['cost_gold']} or", 24, COLOR_UI)
             surface.blit(cost_text, (50 + i * self.spacing, 120 + self.icon_size + 5))
 
         # Ligne bas : Armée actuelle (à congédier)
-        dismiss_text = self.font.render("Votre armée (cliquez sur l'icône pour congédier) :", True, COLOR_UI)
+        dismiss_text = text.render("Votre armée (cliquez sur l'icône pour congédier) :", 24, COLOR_UI)
         surface.blit(dismiss_text, (50, HEIGHT - 120 - self.icon_size - 20))
-        for i, (soldier_type, qty) in enumerate(self.king.army.items()):
-            soldier = SOLDIERS[soldier_type]
-            icon_surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
-            soldier["icon_func"](icon_surf, (self.icon_size//2, self.icon_size//2))
-            surface.blit(icon_surf, (50 + i * self.spacing, HEIGHT - 120 - self.icon_size))
-            qty_text = self.font.render(f"x{qty}", True, COLOR_UI)
+        for i, (soldier_type, qty) in enumerate(itertools.islice(self.king.army.items(), catalog_visible(self.spacing))):
+            surface.blit(catalog_icon(SOLDIERS, soldier_type, self.icon_size), (50 + i * self.spacing, HEIGHT - 120 - self.icon_size))
+            qty_text = text.render(f"x{qty}", 24, COLOR_UI)
             surface.blit(qty_text, (50 + i * self.spacing + self.icon_size - 20, HEIGHT - 120 - self.icon_size + self.icon_size - 20))
 
-        help_ = self.font.render("[ESC] Retour", True, COLOR_UI)
+        help_ = text.render("[ESC] Retour", 24, COLOR_UI)
         surface.blit(help_, (20, HEIGHT-36))
+        return [surface.get_rect()]
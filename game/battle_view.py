@@ -1,9 +1,7 @@
 import pygame
 from settings import WIDTH, HEIGHT, COLOR_UI
 from .scene import Scene
-
-def _font(size: int) -> pygame.font.Font:
-    return pygame.font.Font(None, size)
+from . import text
 
 class BattleView(Scene):
     """Placeholder combat : juste un écran avec issue rapide."""
@@ -17,13 +15,21 @@ class BattleView(Scene):
                 # Pour l'instant, quelle que soit l'issue -> retour carte
                 self.mgr.pop()
 
+    @property
+    def animating(self) -> bool:
+        return False  # écran fixe entre deux clics
+
     def update(self, dt: float):
         pass
 
     def draw(self, surface: pygame.Surface):
+        if not self._redraw:
+            return []  # écran fixe
+        self._redraw = False
         surface.fill((55, 40, 40))
-        title = _font(42).render("Combat !", True, COLOR_UI)
+        title = text.render("Combat !", 42, COLOR_UI)
         surface.blit(title, (WIDTH//2 - title.get_width()//2, 160))
 
-        info = _font(28).render(self.msg, True, COLOR_UI)
+        info = text.render(self.msg, 28, COLOR_UI)
         surface.blit(info, (WIDTH//2 - info.get_width()//2, 250))
+        return [surface.get_rect()]
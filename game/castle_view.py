@@ -1,17 +1,69 @@
 import math
+from collections import OrderedDict
+import numpy as np
 import pygame
 from settings import WIDTH, HEIGHT, COLOR_UI
 from .scene import Scene
+from . import text
+from .profiler import profiled
 from .battle_view import BattleView
 from .shop_view import ShopView
 from .barracks_view import BarracksView
 
-def _font(sz: int) -> pygame.font.Font:
-    return pygame.font.Font(None, sz)
+STATIC_PROBE_DT = 0.1   # s entre deux échantillons pour borner la zone balayée par une animation
+STATIC_PROBE_SPAN = 3.0  # s échantillonnées (≥ une période de l'arbre, ≥ 90° de pales)
+
+SURFACE_BUDGET_BYTES = 4 * 1024 * 1024  # ombres + dégradés mis en cache
+
+# zones dessinées par entité, par disposition (taille d'écran + entités) : la disposition est
+# la même pour tous les châteaux, le balayage des animations n'est fait qu'une fois par session
+_bounds_cache: dict[tuple, list[pygame.Rect]] = {}
+
+# =============== Cache de surfaces (ombres, dégradés) ===============
+_surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+_surfaces_bytes = 0
+
+def _cached_surface(key: tuple, build) -> pygame.Surface:
+    """LRU borné en octets ; build() n'est appelé qu'au premier usage de la clé."""
+    global _surfaces_bytes
+    surf = _surfaces.get(key)
+    if surf is not None:
+        _surfaces.move_to_end(key)
+        return surf
+    surf = _surfaces[key] = build()
+    _surfaces_bytes += surf.get_pitch() * surf.get_height()
+    while _surfaces_bytes > SURFACE_BUDGET_BYTES and len(_surfaces) > 1:
+        _, old = _surfaces.popitem(last=False)
+        _surfaces_bytes -= old.get_pitch() * old.get_height()
+    return surf
+
+def _shadow_surface(w: int, h: int) -> pygame.Surface:
+    """Ombre noire dont l'alpha décroît de 120 à 0 du haut vers le bas (une ligne pleine par rangée)."""
+    def build():
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 0))
+        if w and h:
+            alpha = (120 * (1 - np.arange(h) / h)).astype(np.uint8)
+            pygame.surfarray.pixels_alpha(surf)[:] = alpha[None, :]
+        return surf
+    return _cached_surface(("shadow", w, h), build)
+
+def _gradient_surface(w: int, h: int, base_color, dark_color) -> pygame.Surface:
+    """Dégradé vertical base_color -> dark_color, calculé en bloc."""
+    def build():
+        surf = pygame.Surface((w, h))
+        if w and h:
+            k = (np.arange(h) / h)[:, None]
+            rows = (np.array(base_color) * (1 - k) + np.array(dark_color) * k).astype(np.uint8)
+            pygame.surfarray.blit_array(surf, np.broadcast_to(rows[None], (w, h, 3)))
+        return surf
+    return _cached_surface(("gradient", w, h, tuple(base_color), tuple(dark_color)), build)
 
 # =============== Base ===============
 class _Entity:
     """Élément dessinable avec z-order basé sur le bas du rect (effet de profondeur)."""
+    animated = False  # True : redessiné à chaque frame (hors couche statique)
+
     def __init__(self, name: str, rect: pygame.Rect, kind: str,
                  hint: str | None = None, interactive: bool = False):
         self.name = name
@@ -34,15 +86,17 @@ def _rect_centered_on_line(cx: int, base_y: int, w: int, h: int, offset_x: int =
 
 # =============== Bâtiments ===============
 class _Building(_Entity):
+    @property
+    def animated(self) -> bool:
+        return self.kind == "mill"  # pales
+
+    @profiled()
     def draw(self, surf: pygame.Surface, t: float):
         x, y, w, h = self.rect
         # Ombre améliorée : directionnelle, plus longue pour front, avec gradient doux
         shadow_offset = (int(w * 0.12), int(h * 0.18)) if self.rect.bottom > HEIGHT * 0.7 else (int(w * 0.06), int(h * 0.10))
         sh_w, sh_h = w + shadow_offset[0], int(h * 0.25) + shadow_offset[1]
-        shadow = pygame.Surface((sh_w, sh_h), pygame.SRCALPHA)
-        for i in range(sh_h):
-            alpha = int(120 * (1 - i / sh_h))  # Ombre plus prononcée
-            pygame.draw.ellipse(shadow, (0, 0, 0, alpha), (0, i, sh_w, 1))
+        shadow = _shadow_surface(sh_w, sh_h)
         surf.blit(shadow, (x + (w - sh_w)//2, y + h - sh_h//2))
         
         by = y - h
@@ -62,8 +116,8 @@ class _Building(_Entity):
             self._draw_house(surf, x, by, w, h)
         
         # Label avec ombre pour lisibilité
-        label = _font(18).render(self.name, True, COLOR_UI)
-        label_shadow = _font(18).render(self.name, True, (0, 0, 0))
+        label = text.render(self.name, 18, COLOR_UI)
+        label_shadow = text.render(self.name, 18, (0, 0, 0))
         surf.blit(label_shadow, (x + w // 2 - label.get_width() // 2 + 2, y + 8))
         surf.blit(label, (x + w // 2 - label.get_width() // 2, y + 6))
         
@@ -80,15 +134,8 @@ class _Building(_Entity):
         pygame.draw.lines(surf, line, False, pts, 2)
 
     def _draw_gradient_body(self, surf, rect, base_color, dark_color):
-        """Gradient vertical pour volume (haut clair, bas sombre)."""
-        for i in range(rect.height):
-            k = i / rect.height
-            c = (
-                int(base_color[0] * (1 - k) + dark_color[0] * k),
-                int(base_color[1] * (1 - k) + dark_color[1] * k),
-                int(base_color[2] * (1 - k) + dark_color[2] * k)
-            )
-            pygame.draw.line(surf, c, (rect.left, rect.top + i), (rect.right, rect.top + i))
+        """Gradient vertical pour volume (haut clair, bas sombre) ; lignes de rect.left à rect.right inclus."""
+        surf.blit(_gradient_surface(rect.width + 1, rect.height, base_color, dark_color), rect.topleft)
 
     # ---- Types (améliorés avec détails médiévaux) ----
     def _draw_house(self, surf, x, by, w, h):
@@ -208,6 +255,8 @@ class _Building(_Entity):
 
 # =============== Décor léger ===============
 class _Tree(_Entity):
+    animated = True  # balancement
+
     def draw(self, surf: pygame.Surface, t: float):
         x, y, w, h = self.rect
         by = y - h
@@ -231,8 +280,6 @@ class CastleView(Scene):
     def __init__(self, mgr, castle):
         super().__init__(mgr)
         self.castle = castle
-        self._title_font = _font(40)
-        self._ui_font = _font(22)
         self._t = 0.0
         self.horizon_y = int(HEIGHT * 0.35)
         self.line_back = self.horizon_y + 130
@@ -277,7 +324,60 @@ class CastleView(Scene):
             if ent.kind == "tree" and ent.rect.bottom > self.line_mid:
                 ent.rect.bottom += 2
         self._tooltip: str | None = None
+        # couche statique (fond + bâtiments immobiles) reconstruite sur resize / survol
+        self._static: pygame.Surface | None = None
+        self._static_key = None
+        self._live: list[_Entity] = []
+        self._bounds: dict[int, pygame.Rect] | None = None
+        self._tip_rect: pygame.Rect | None = None
+
+    def _entity_bounds(self, size) -> dict[int, pygame.Rect]:
+        """Zone dessinée par chaque entité, calculée une fois par disposition (_bounds_cache)."""
+        key = (tuple(size), tuple((type(e).__name__, e.kind, tuple(e.rect)) for e in self.entities))
+        boxes = _bounds_cache.get(key)
+        if boxes is None:
+            boxes = _bounds_cache[key] = self._probe_bounds(size)
+        return {id(e): box.copy() for e, box in zip(self.entities, boxes)}
+
+    @profiled()
+    def _probe_bounds(self, size) -> list[pygame.Rect]:
+        """Mesure en pixels (balayage complet de l'animation si animée), dans l'ordre de self.entities."""
+        scratch = pygame.Surface(size, pygame.SRCALPHA)
+        out = []
+        for ent in self.entities:
+            hover, ent.hover = ent.hover, False
+            scratch.fill((0, 0, 0, 0))
+            steps = int(STATIC_PROBE_SPAN / STATIC_PROBE_DT) if ent.animated else 1
+            for k in range(steps):
+                ent.draw(scratch, k * STATIC_PROBE_DT)  # accumulé : une seule mesure
+            ent.hover = hover
+            alpha = pygame.surfarray.pixels_alpha(scratch)  # (w, h), bien plus rapide que get_bounding_rect
+            xs, ys = np.flatnonzero(alpha.any(axis=1)), np.flatnonzero(alpha.any(axis=0))
+            del alpha  # libère le verrou de la surface
+            box = pygame.Rect(xs[0], ys[0], xs[-1] - xs[0] + 1, ys[-1] - ys[0] + 1) if len(xs) else pygame.Rect(0, 0, 0, 0)
+            out.append(box.inflate(4, 4))
+        return out
 
+    @profiled()
+    def _build_static(self, size):
+        """Fond + entités immobiles qui ne passent devant aucune entité animée."""
+        if self._bounds is None or self._static is None or self._static.get_size() != size:
+            self._bounds = self._entity_bounds(size)
+        live = []
+        static = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            static = static.convert()
+        self._draw_background(static)
+        for ent in sorted(self.entities, key=lambda e: e.z):
+            box = self._bounds[id(ent)]
+            # devant une entité redessinée -> doit l'être aussi, dans l'ordre z
+            if ent.animated or any(box.colliderect(self._bounds[id(e)]) for e in live):
+                live.append(ent)
+            else:
+                ent.draw(static, self._t)
+        self._static, self._live = static, live
+
+    @profiled()
     def _draw_background(self, surf: pygame.Surface):
         top, bot = (18, 20, 26), (34, 36, 42)
         for i in range(self.horizon_y):
@@ -293,7 +393,7 @@ class CastleView(Scene):
         for i in range(0, WIDTH, 10):
             wy = path_y + 20 + int(5 * math.sin(i / 50))
             pygame.draw.line(surf, (126, 118, 104), (i, wy), (i+10, wy), 2)
-        title = self._title_font.render(self.castle.name, True, COLOR_UI)
+        title = text.render(self.castle.name, 40, COLOR_UI)
         surf.blit(title, (WIDTH // 2 - title.get_width() // 2, 18))
 
     def handle_event(self, event):
@@ -325,18 +425,35 @@ class CastleView(Scene):
         self._t += dt
 
     def draw(self, surface: pygame.Surface):
-        self._draw_background(surface)
-        for ent in sorted(self.entities, key=lambda e: e.z):
+        key = (surface.get_size(), tuple(e.hover for e in self.entities))
+        if key != self._static_key:
+            self._build_static(surface.get_size())
+            self._static_key = key
+            self._redraw = True
+        surface.blit(self._static, (0, 0))
+        for ent in self._live:
             ent.draw(surface, self._t)
         bar = pygame.Rect(0, HEIGHT - 44, WIDTH, 44)
         pygame.draw.rect(surface, (24, 24, 24), bar)
-        txt = self._ui_font.render("⇦ ESC • Clique : Hôtel de ville / Boutique / Caserne", True, (235, 235, 235))
+        txt = text.render("⇦ ESC • Clique : Hôtel de ville / Boutique / Caserne", 22, (235, 235, 235))
         surface.blit(txt, (16, HEIGHT - 34))
         if self._tooltip:
-            tt = self._ui_font.render(self._tooltip, True, (16, 16, 16))
+            tt = text.render(self._tooltip, 22, (16, 16, 16))
             box = tt.get_rect()
             mx, my = pygame.mouse.get_pos()
             box.topleft = (mx + 18, my + 6)
             pygame.draw.rect(surface, (240, 240, 240), box.inflate(14, 10), border_radius=6)
             pygame.draw.rect(surface, (64, 64, 64), box.inflate(14, 10), 2, border_radius=6)
             surface.blit(tt, box)
+            tip = box.inflate(14, 10)
+        else:
+            tip = None
+
+        # zones modifiées : entités animées + infobulle (ancienne et nouvelle position)
+        prev_tip, self._tip_rect = self._tip_rect, tip
+        if self._redraw:
+            self._redraw = False
+            return [surface.get_rect()]
+        rects = [self._bounds[id(e)] for e in self._live]
+        rects += [r for r in (prev_tip, tip) if r is not None]
+        return rects
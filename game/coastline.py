@@ -0,0 +1,48 @@
+"""
+Index des points de côte, extrait une seule fois par détection de bord sur une grille terre/eau.
+Un point de côte est un point de terre dont un voisin à `reach` px (4-voisinage) est de l'eau ;
+sa normale pointe vers la mer. Le placement des ports tire directement parmi ces candidats.
+"""
+import numpy as np
+
+COAST_STEP = 6   # px monde entre deux échantillons
+COAST_REACH = 18  # px : même critère que l'ancienne sonde (terre + eau à ±18 px)
+
+
+class CoastIndex:
+    def __init__(self, points: np.ndarray, normals: np.ndarray):
+        """points : (n, 2) int32 en coords monde ; normals : (n, 2) float32 unitaires vers l'eau."""
+        self.points = points
+        self.normals = normals
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @classmethod
+    def from_world(cls, world, world_w: int, world_h: int, step: int = COAST_STEP, reach: int = COAST_REACH):
+        """Échantillonne world.is_water_many (terrain + îlots forcés) puis garde les cellules de bord."""
+        gw, gh = -(-world_w // step), -(-world_h // step)
+        xs = (np.arange(gw) * step)[None, :].repeat(gh, 0)
+        ys = (np.arange(gh) * step)[:, None].repeat(gw, 1)
+        water = world.is_water_many(xs, ys)
+        k = max(1, round(reach / step))
+        pad = np.pad(water, k, mode="edge")
+        right, left = pad[k:-k, 2*k:], pad[k:-k, :-2*k]
+        down, up = pad[2*k:, k:-k], pad[:-2*k, k:-k]
+        coast = ~water & (right | left | down | up)
+        j, i = np.nonzero(coast)  # ordre ligne par ligne : déterministe
+        nx = right[j, i].astype(np.float32) - left[j, i]
+        ny = down[j, i].astype(np.float32) - up[j, i]
+        norm = np.hypot(nx, ny)
+        norm[norm == 0] = 1.0  # eau des deux côtés : normale nulle
+        points = np.stack([i * step, j * step], axis=1).astype(np.int32)
+        return cls(points, np.stack([nx / norm, ny / norm], axis=1))
+
+    def within_rect(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """Indices des points dans [x0, x1] x [y0, y1]."""
+        p = self.points
+        return np.nonzero((p[:, 0] >= x0) & (p[:, 0] <= x1) & (p[:, 1] >= y0) & (p[:, 1] <= y1))[0]
+
+    def within_radius(self, x: float, y: float, r: float) -> np.ndarray:
+        d2 = (self.points[:, 0] - x) ** 2 + (self.points[:, 1] - y) ** 2
+        return np.nonzero(d2 <= r * r)[0]
@@ -0,0 +1,97 @@
+"""
+Champ de distance à la côte, précalculé sur une grille grossière.
+Pour chaque cellule : la cellule de terre la plus proche et la cellule d'eau la plus proche
+(transformée de distance par « jump flooding », 1+JFA, entièrement vectorisée NumPy).
+La cellule (i, j) porte la valeur du point monde (i*cell, j*cell).
+"""
+import numpy as np
+
+COAST_CELL = 4  # px monde par cellule
+
+
+def _jump_flood(seeds: np.ndarray) -> np.ndarray:
+    """(gh, gw, 2) int32 : (j, i) du germe le plus proche de chaque cellule, -1 s'il n'y en a aucun."""
+    gh, gw = seeds.shape
+    jj, ii = np.indices((gh, gw), dtype=np.int32)
+    nj = np.where(seeds, jj, -1).astype(np.int32)
+    ni = np.where(seeds, ii, -1).astype(np.int32)
+    best = np.where(seeds, 0, np.iinfo(np.int32).max).astype(np.int32)
+    step = 1
+    while step * 2 < max(gh, gw):
+        step *= 2
+    steps = []
+    while step >= 1:
+        steps.append(step); step //= 2
+    steps.append(1)  # passe supplémentaire (1+JFA) : corrige la plupart des erreurs résiduelles
+    for s in steps:
+        for dy in (-s, 0, s):
+            for dx in (-s, 0, s):
+                if (dx == 0 and dy == 0) or abs(dy) >= gh or abs(dx) >= gw:
+                    continue
+                # candidat = germe connu de la cellule voisine (j+dy, i+dx), sans repliement
+                dst = (slice(max(0, -dy), gh - max(0, dy)), slice(max(0, -dx), gw - max(0, dx)))
+                src = (slice(max(0, dy), gh - max(0, -dy)), slice(max(0, dx), gw - max(0, -dx)))
+                cj, ci = nj[src], ni[src]
+                d = (cj - jj[dst]) ** 2 + (ci - ii[dst]) ** 2
+                better = (cj >= 0) & (d < best[dst])
+                if not better.any():
+                    continue
+                nj[dst] = np.where(better, cj, nj[dst])
+                ni[dst] = np.where(better, ci, ni[dst])
+                best[dst] = np.where(better, d, best[dst])
+    return np.stack([nj, ni], axis=-1)
+
+
+class CoastField:
+    def __init__(self, water: np.ndarray, cell: int = COAST_CELL):
+        """water : booléens (gh, gw) échantillonnés aux points (i*cell, j*cell)."""
+        self.cell = cell
+        self.water = water
+        self.gh, self.gw = water.shape
+        self._near_land = _jump_flood(~water)
+        self._near_water = _jump_flood(water)
+
+    @classmethod
+    def from_world(cls, world, world_w: int, world_h: int, cell: int = COAST_CELL):
+        """Échantillonne world.is_water_many (terrain + îlots forcés) sur la grille."""
+        gw, gh = -(-world_w // cell), -(-world_h // cell)
+        xs = (np.arange(gw) * cell)[None, :].repeat(gh, 0)
+        ys = (np.arange(gh) * cell)[:, None].repeat(gw, 1)
+        return cls(world.is_water_many(xs, ys), cell)
+
+    def _cell(self, x, y):
+        # cellule dont le point d'échantillonnage est le plus proche
+        i = min(max(int(round(x / self.cell)), 0), self.gw - 1)
+        j = min(max(int(round(y / self.cell)), 0), self.gh - 1)
+        return i, j
+
+    def _lookup(self, table, x, y):
+        i, j = self._cell(x, y)
+        nj, ni = table[j, i]
+        if nj < 0:
+            return None
+        return int(ni) * self.cell, int(nj) * self.cell
+
+    # ---------- requêtes O(1) ----------
+    def nearest_land(self, x, y) -> tuple[int, int] | None:
+        """Point monde de terre le plus proche (lui-même si déjà sur terre)."""
+        return self._lookup(self._near_land, x, y)
+
+    def nearest_water(self, x, y) -> tuple[int, int] | None:
+        return self._lookup(self._near_water, x, y)
+
+    def distance_to_coast(self, x, y) -> float:
+        """Distance (px) jusqu'au terrain de l'autre type : > 0 en mer comme sur terre."""
+        i, j = self._cell(x, y)
+        table = self._near_land if self.water[j, i] else self._near_water
+        nj, ni = table[j, i]
+        if nj < 0:
+            return float("inf")
+        return float(np.hypot(int(ni) - i, int(nj) - j)) * self.cell
+
+    def coast_mask(self, width: int = 1) -> np.ndarray:
+        """Cellules de terre à `width` cellules ou moins de l'eau (détection de côte)."""
+        nj, ni = self._near_water[..., 0], self._near_water[..., 1]
+        jj, ii = np.indices(self.water.shape)
+        d2 = (nj - jj) ** 2 + (ni - ii) ** 2
+        return ~self.water & (nj >= 0) & (d2 <= width * width)
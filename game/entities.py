@@ -1,6 +1,8 @@
 import math
 import pygame
-from settings import COLOR_KING, COLOR_ENEMY, COLOR_PLAYER
+from settings import WIDTH, COLOR_KING, COLOR_ENEMY, COLOR_PLAYER
+from . import text
+from .atlas import ATLAS
 
 def _draw_outline_circle(surf, pos, radius, fill, outline=(25,25,25), w=2, shadow=(0,0,0), so=(2,2)):
     pygame.draw.circle(surf, shadow, (int(pos.x+so[0]), int(pos.y+so[1])), radius)
@@ -28,8 +30,10 @@ class King:
     """Représente le roi avec mouvement et inventaire."""
     def __init__(self, x: float, y: float, speed: float = 200.0):
         self.pos = pygame.Vector2(x, y)  # monde
+        self.prev_pos = self.pos.copy()  # position au pas de simulation précédent (interpolation)
         self.speed = speed
         self.target: pygame.Vector2 | None = None
+        self.path: list[pygame.Vector2] = []  # points de passage restants après target
         self.mode = "land"  # "land" ou "boat"
         # Inventaire
         self.resources = {
@@ -41,32 +45,63 @@ class King:
 
     def move_to(self, x: float, y: float):
         self.target = pygame.Vector2(x, y)
+        self.path = []
+
+    def follow(self, waypoints):
+        """Suit une liste de points de passage (ex. résultat de NavGrid.find_path)."""
+        pts = [pygame.Vector2(p) for p in waypoints]
+        self.target = pts[0] if pts else None
+        self.path = pts[1:]
+
+    def stop(self):
+        self.target = None
+        self.path = []
 
     @property
     def moving(self) -> bool:
         return self.target is not None
 
+    def snap(self):
+        """Après une téléportation : pas d'interpolation depuis l'ancienne position."""
+        self.prev_pos.update(self.pos)
+
+    def render_pos(self, alpha: float = 1.0) -> pygame.Vector2:
+        """Position à afficher, alpha ∈ [0, 1] entre le pas précédent et le pas courant."""
+        return self.prev_pos.lerp(self.pos, alpha)
+
     def update(self, dt: float):
-        if not self.target:
-            return
-        to = self.target - self.pos
-        dist = to.length()
+        self.prev_pos.update(self.pos)
         step = self.speed * dt
-        if dist <= step:
-            self.pos = self.target
-            self.target = None
-        else:
-            self.pos += to.normalize() * step
+        # le reste du pas continue vers le point de passage suivant
+        while self.target is not None and step > 0:
+            to = self.target - self.pos
+            dist = to.length()
+            if dist <= step:
+                self.pos = pygame.Vector2(self.target)
+                step -= dist
+                self.target = self.path.pop(0) if self.path else None
+            else:
+                self.pos += to.normalize() * step
+                step = 0
 
     def is_near(self, x: float, y: float, radius: float = 16.0) -> bool:
         return self.pos.distance_to(pygame.Vector2(x, y)) <= radius
 
-    def draw(self, surf: pygame.Surface, offset=pygame.Vector2(), color=COLOR_KING):
-        screen_pos = self.pos - offset
+    def sprite(self, color=COLOR_KING) -> tuple[pygame.Surface, tuple[int, int]]:
         t = pygame.time.get_ticks() * 0.003
         pulse = 2 + int(2 * (1 + math.sin(t)))
+        paint = lambda surf, sp: self._paint(surf, sp, pulse, self.mode, color)
+        return ATLAS.get(("king", tuple(color), self.mode, pulse), (44, 44), (22, 22), paint)
+
+    def draw(self, surf: pygame.Surface, offset=pygame.Vector2(), color=COLOR_KING, alpha: float = 1.0):
+        img, (ax, ay) = self.sprite(color)
+        pos = self.render_pos(alpha)
+        surf.blit(img, (int(pos.x - offset.x) - ax, int(pos.y - offset.y) - ay))
+
+    @staticmethod
+    def _paint(surf: pygame.Surface, screen_pos: pygame.Vector2, pulse: int, mode: str, color):
         _draw_outline_circle(surf, screen_pos, 12 + pulse, color)
-        if self.mode == "boat":
+        if mode == "boat":
             _draw_boat_icon(surf, screen_pos)
         else:
             # petite couronne stylisée
@@ -141,6 +176,24 @@ SOLDIERS = {
     "Soigneur": {"cost_gold": 180, "cost_food": 60, "icon_func": lambda surf, center: pygame.draw.circle(surf, (50, 200, 50), center, 8)},
 }
 
+_ICONS: dict = {}  # (icon_func, taille) -> Surface
+
+def catalog_icon(catalog: dict, name: str, size: int) -> pygame.Surface:
+    """Icône (size x size) d'un article de EQUIPMENTS / SOLDIERS, rendue au premier usage."""
+    func = catalog[name]["icon_func"]
+    icon = _ICONS.get((func, size))
+    if icon is None:
+        icon = pygame.Surface((size, size), pygame.SRCALPHA)
+        func(icon, (size//2, size//2))
+        if pygame.display.get_surface() is not None:
+            icon = icon.convert_alpha()
+        _ICONS[(func, size)] = icon
+    return icon
+
+def catalog_visible(spacing: int, left: int = 50) -> int:
+    """Icônes de catalogue qui tiennent sur une ligne partant de `left` : les suivantes sont hors écran."""
+    return max(0, -(-(WIDTH - left) // spacing))
+
 class Castle:
     def __init__(self, name: str, x: float, y: float, owner: str = "enemy", radius: int = 18):
         self.name = name
@@ -151,9 +204,16 @@ class Castle:
     def is_point_inside(self, x: float, y: float) -> bool:
         return self.pos.distance_to(pygame.Vector2(x, y)) <= self.radius
 
+    def sprite(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        r = self.radius
+        return ATLAS.get(("castle", self.owner, r), (2*r + 28, 2*r + 20), (r + 14, r + 17), self._paint)
+
     def draw(self, surf: pygame.Surface, offset=pygame.Vector2()):
+        img, (ax, ay) = self.sprite()
+        surf.blit(img, (int(self.pos.x - offset.x) - ax, int(self.pos.y - offset.y) - ay))
+
+    def _paint(self, surf: pygame.Surface, screen_pos: pygame.Vector2):
         col = COLOR_PLAYER if self.owner == "player" else COLOR_ENEMY
-        screen_pos = self.pos - offset
         _draw_outline_circle(surf, screen_pos, self.radius, col)
         pole_top = (screen_pos.x, screen_pos.y - self.radius - 16)
         pygame.draw.line(surf, (30,30,30), (screen_pos.x, screen_pos.y - self.radius), pole_top, 2)
@@ -171,8 +231,15 @@ class Port:
     def is_point_inside(self, x: float, y: float) -> bool:
         return self.pos.distance_to(pygame.Vector2(x, y)) <= self.radius
 
+    def sprite(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        e = self.radius + 20  # halo extérieur (rayon + 3*6) + marge
+        return ATLAS.get(("port", self.radius), (2*e, 2*e), (e, e), self._paint)
+
     def draw(self, surf: pygame.Surface, offset=pygame.Vector2()):
-        sp = self.pos - offset
+        img, (ax, ay) = self.sprite()
+        surf.blit(img, (int(self.pos.x - offset.x) - ax, int(self.pos.y - offset.y) - ay))
+
+    def _paint(self, surf: pygame.Surface, sp: pygame.Vector2):
         # Halo de vagues concentriques (très visible)
         for i in range(3, 0, -1):
             pygame.draw.circle(surf, (255,255,255), (int(sp.x), int(sp.y)), self.radius + i*6, 1)
@@ -185,6 +252,5 @@ class Port:
         pygame.draw.polygon(surf, (240,240,240),
                             [(sp.x, sp.y-32),(sp.x+12, sp.y-28),(sp.x, sp.y-24)])
         # Label "PORT"
-        f = pygame.font.Font(None, 22)
-        lab = f.render("PORT", True, (245,245,245))
+        lab = text.render("PORT", 22, (245,245,245))
         surf.blit(lab, (sp.x - lab.get_width()/2, sp.y + rect.height/2 + 6))
@@ -0,0 +1,76 @@
+import math, threading
+import pygame
+from settings import WIDTH, HEIGHT, COLOR_UI
+from .scene import Scene
+from . import text
+
+class LoadingView(Scene):
+    """
+    Écran de chargement : exécute world.iter_generation() sur un thread de travail
+    et remplace cette scène par `world` une fois la génération terminée.
+    - La boucle principale continue de tourner (fenêtre réactive)
+    - [ESC] interrompt la génération entre deux étapes et quitte
+    """
+    def __init__(self, mgr, world):
+        super().__init__(mgr)
+        self.world = world
+        self.stage = "Préparation"
+        self.progress = 0.0
+        self._t = 0.0
+        self._done = False
+        self._error: BaseException | None = None
+        self._cancel = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _run(self):
+        try:
+            for stage, progress in self.world.iter_generation():
+                if self._cancel.is_set():
+                    return
+                self.stage, self.progress = stage, progress
+            self.progress = 1.0
+            self._done = True
+        except BaseException as exc:  # relayé au thread principal dans update()
+            self._error = exc
+
+    def on_enter(self):
+        self._thread = threading.Thread(target=self._run, name="world-gen", daemon=True)
+        self._thread.start()
+
+    def on_exit(self):
+        self._cancel.set()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self._cancel.set()
+            self.mgr.quit = True
+
+    def update(self, dt: float):
+        self._t += dt
+        if self._error is not None:
+            raise self._error
+        if self._done:
+            self.mgr.replace(self.world)
+
+    def draw(self, surface: pygame.Surface):
+        surface.fill((20, 28, 40))
+        title = text.render("Génération du monde…", 40, COLOR_UI)
+        surface.blit(title, (WIDTH//2 - title.get_width()//2, HEIGHT//2 - 90))
+
+        bar = pygame.Rect(0, 0, 520, 22); bar.center = (WIDTH//2, HEIGHT//2)
+        pygame.draw.rect(surface, (50, 60, 75), bar, border_radius=6)
+        fill = bar.copy(); fill.width = int(bar.width * self.progress)
+        if fill.width > 0:
+            pygame.draw.rect(surface, (235, 215, 160), fill, border_radius=6)
+        pygame.draw.rect(surface, (235, 235, 235), bar, 2, border_radius=6)
+
+        # petit indicateur animé : prouve que la fenêtre reste réactive
+        for i in range(8):
+            a = self._t * 4 + i * math.tau / 8
+            c = 90 + int(150 * ((i + 1) / 8))
+            pygame.draw.circle(surface, (c, c, c), (int(bar.right + 34 + math.cos(a) * 10), int(bar.centery + math.sin(a) * 10)), 3)
+
+        stage = text.render(self.stage, 24, COLOR_UI)
+        surface.blit(stage, (WIDTH//2 - stage.get_width()//2, bar.bottom + 18))
+        help_ = text.render("[ESC] Annuler et quitter", 24, COLOR_UI)
+        surface.blit(help_, (20, HEIGHT-36))
@@ -0,0 +1,197 @@
+"""
+Recherche de chemin A* sur une grille de navigation grossière dérivée du terrain.
+- une grille praticable par mode de déplacement ("land" / "boat")
+- tas binaire (heapq) pour l'ensemble ouvert, heuristique octile, pas de coupe de coin
+- composantes connexes précalculées : une cible inaccessible est rejetée sans exploration
+- lissage par ligne de vue + cache LRU des chemins récents
+"""
+import heapq, math
+from collections import OrderedDict, deque
+import numpy as np
+
+NAV_CELL = 16         # px monde par cellule de navigation
+PATH_CACHE_SIZE = 128
+SNAP_RADIUS = 6       # cellules : recherche d'une cellule praticable autour d'une extrémité
+
+_SQRT2 = math.sqrt(2.0)
+_NEIGHBOURS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+               (1, 1, _SQRT2), (1, -1, _SQRT2), (-1, 1, _SQRT2), (-1, -1, _SQRT2)]
+
+
+class NavGrid:
+    def __init__(self, world_w: int, world_h: int, walkable: dict[str, np.ndarray], cell: int = NAV_CELL):
+        """walkable[mode] : tableau booléen (gh, gw) des cellules praticables."""
+        self.world_w, self.world_h = world_w, world_h
+        self.cell = cell
+        self.gh, self.gw = next(iter(walkable.values())).shape
+        self._walk = {mode: grid.ravel().tolist() for mode, grid in walkable.items()}
+        # voisins praticables (index, coût) précalculés : boucle A* sans arithmétique de grille
+        self._adj = {mode: [list(self._neighbours(i, w)) if w[i] else [] for i in range(len(w))]
+                     for mode, w in self._walk.items()}
+        self._comp = {mode: self._label(mode) for mode in self._walk}
+        self._cache: OrderedDict = OrderedDict()
+
+    @classmethod
+    def from_world(cls, world, world_w: int, world_h: int, cell: int = NAV_CELL):
+        """
+        Cellule praticable à terre si son centre et ses 4 coins (rentrés d'un quart) sont de la terre,
+        praticable en bateau si ces 5 points sont de l'eau : les chemins restent loin des côtes ambiguës.
+        """
+        gw, gh = -(-world_w // cell), -(-world_h // cell)
+        cx = (np.arange(gw) * cell + cell / 2)[None, :].repeat(gh, 0)
+        cy = (np.arange(gh) * cell + cell / 2)[:, None].repeat(gw, 1)
+        q = cell / 4
+        water = [world.is_water_many(np.clip(cx + dx, 0, world_w - 1), np.clip(cy + dy, 0, world_h - 1))
+                 for dx, dy in ((0, 0), (-q, -q), (q, -q), (-q, q), (q, q))]
+        all_water = np.logical_and.reduce(water)
+        all_land = ~np.logical_or.reduce(water)
+        return cls(world_w, world_h, {"land": all_land, "boat": all_water}, cell)
+
+    # ---------- grille ----------
+    def _label(self, mode: str) -> list:
+        """Composantes connexes (8-voisinage, même règle de coin que A*)."""
+        walk, adj = self._walk[mode], self._adj[mode]
+        comp = [-1] * len(walk)
+        label = 0
+        for start, ok in enumerate(walk):
+            if not ok or comp[start] >= 0:
+                continue
+            comp[start] = label
+            queue = deque([start])
+            while queue:
+                cur = queue.popleft()
+                for n, _ in adj[cur]:
+                    if comp[n] < 0:
+                        comp[n] = label
+                        queue.append(n)
+            label += 1
+        return comp
+
+    def _neighbours(self, cur: int, walk: list):
+        gw, gh = self.gw, self.gh
+        cx, cy = cur % gw, cur // gw
+        for dx, dy, step in _NEIGHBOURS:
+            nx, ny = cx + dx, cy + dy
+            if 0 <= nx < gw and 0 <= ny < gh and walk[ny * gw + nx]:
+                if dx and dy and not (walk[cy * gw + nx] and walk[ny * gw + cx]):
+                    continue
+                yield ny * gw + nx, step
+
+    def _cell_of(self, x: float, y: float) -> int:
+        i = min(max(int(x) // self.cell, 0), self.gw - 1)
+        j = min(max(int(y) // self.cell, 0), self.gh - 1)
+        return j * self.gw + i
+
+    def _center(self, idx: int) -> tuple[float, float]:
+        return ((idx % self.gw) * self.cell + self.cell / 2, (idx // self.gw) * self.cell + self.cell / 2)
+
+    def _snap(self, idx: int, mode: str, comp: int | None = None) -> int | None:
+        """Cellule praticable la plus proche (dans la composante `comp` si donnée)."""
+        walk, comps = self._walk[mode], self._comp[mode]
+        ok = lambda n: walk[n] and (comp is None or comps[n] == comp)
+        if ok(idx):
+            return idx
+        cx, cy = idx % self.gw, idx // self.gw
+        for r in range(1, SNAP_RADIUS + 1):
+            best, best_d = None, None
+            for dy in range(-r, r + 1):
+                for dx in range(-r, r + 1):
+                    if max(abs(dx), abs(dy)) != r:
+                        continue
+                    nx, ny = cx + dx, cy + dy
+                    if 0 <= nx < self.gw and 0 <= ny < self.gh and ok(ny * self.gw + nx):
+                        d = dx * dx + dy * dy
+                        if best_d is None or d < best_d:
+                            best, best_d = ny * self.gw + nx, d
+            if best is not None:
+                return best
+        return None
+
+    # ---------- A* ----------
+    def _astar(self, s: int, g: int, mode: str) -> list[int] | None:
+        adj = self._adj[mode]
+        gw = self.gw
+        gx, gy = g % gw, g // gw
+        k = _SQRT2 - 2
+        open_ = [(0.0, 0.0, s)]
+        cost = {s: 0.0}
+        came = {s: -1}
+        push, pop = heapq.heappush, heapq.heappop
+        while open_:
+            _, gc, cur = pop(open_)
+            if cur == g:
+                path = []
+                while cur != -1:
+                    path.append(cur); cur = came[cur]
+                return path[::-1]
+            if gc > cost[cur]:
+                continue  # entrée périmée du tas
+            for n, step in adj[cur]:
+                nc = gc + step
+                if nc < cost.get(n, math.inf):
+                    cost[n] = nc
+                    came[n] = cur
+                    dx, dy = abs(n % gw - gx), abs(n // gw - gy)
+                    h = dx + dy + k * (dx if dx < dy else dy)  # octile
+                    push(open_, (nc + h, nc, n))
+        return None
+
+    # ---------- lissage ----------
+    def _line_of_sight(self, a: tuple, b: tuple, mode: str) -> bool:
+        walk = self._walk[mode]
+        dist = math.hypot(b[0] - a[0], b[1] - a[1])
+        n = max(2, int(dist / (self.cell / 3)) + 1)
+        for k in range(n + 1):
+            t = k / n
+            if not walk[self._cell_of(a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)]:
+                return False
+        return True
+
+    def _smooth(self, pts: list, mode: str) -> list:
+        """String pulling : on ne garde un point que si l'ancre ne voit plus le suivant."""
+        out = [pts[0]]
+        anchor = pts[0]
+        for k in range(1, len(pts) - 1):
+            if not self._line_of_sight(anchor, pts[k + 1], mode):
+                anchor = pts[k]
+                out.append(anchor)
+        out.append(pts[-1])
+        return out
+
+    # ---------- API ----------
+    def find_path(self, start, goal, mode: str) -> list[tuple[float, float]] | None:
+        """
+        Liste de points de passage (monde) de `start` vers `goal`, le point de départ exclu.
+        None si aucune route praticable n'existe pour ce mode.
+        """
+        s = self._snap(self._cell_of(*start), mode)
+        if s is None:
+            return None
+        comp = self._comp[mode][s]
+        g = self._snap(self._cell_of(*goal), mode, comp)
+        if g is None:
+            return None
+        key = (mode, s, g)
+        cells = self._cache.get(key)
+        if cells is None:
+            cells = self._astar(s, g, mode)
+            if cells is None:
+                return None
+            self._cache[key] = cells
+            if len(self._cache) > PATH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        start = (float(start[0]), float(start[1]))
+        goal = (float(goal[0]), float(goal[1]))
+        pts = [start] + [self._center(c) for c in cells[1:]]
+        end = self._center(g)
+        gc = self._cell_of(*goal)
+        near = abs(gc % self.gw - g % self.gw) <= 1 and abs(gc // self.gw - g // self.gw) <= 1
+        if gc != g and not near and not self._line_of_sight(end, goal, mode):
+            goal = end  # but déplacé par _snap (îlot, autre rive) : s'arrêter au bord praticable
+        if len(cells) > 1 and self._cell_of(*goal) == g:
+            pts[-1] = goal  # la cellule d'arrivée contient le but : viser le point exact
+        else:
+            pts.append(goal)  # but dans la même cellule, ou juste à côté (port sur la côte)
+        return self._smooth(pts, mode)[1:]
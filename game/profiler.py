@@ -0,0 +1,189 @@
+"""
+Profileur intégré : spans imbriqués par thread, regroupés par frame dans un tampon circulaire.
+- PROFILER.span("nom") / @profiled("nom") : mesure d'un bloc (coût quasi nul si désactivé)
+- SceneManager trace handle_event / update / draw de la scène courante
+- [F3] active l'enregistrement + l'overlay, [F4] exporte au format Chrome trace-event (chrome://tracing, Perfetto)
+- variable d'environnement GAME_PROFILE=1 : enregistrement dès le lancement (chargement compris)
+"""
+import functools, json, os, threading, time
+from collections import deque
+from pathlib import Path
+import pygame
+
+from . import text
+
+PROFILE_FRAMES = 600          # frames gardées (~10 s à 60 FPS)
+OVERLAY_FRAMES = 240          # frames visibles dans le graphe
+OVERLAY_TOP = 6               # spans les plus coûteux affichés
+FRAME_BUDGET_MS = 1000 / 60   # ligne de repère du graphe
+TRACE_DIR = Path(__file__).resolve().parents[1] / "data" / "traces"
+
+
+class _Span:
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof, name):
+        self.prof, self.name = prof, name
+
+    def __enter__(self):
+        local = self.prof._local
+        local.depth = getattr(local, "depth", 0) + 1
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        t1 = time.perf_counter()
+        local = self.prof._local
+        local.depth -= 1
+        # list.append est atomique : les threads de travail écrivent dans la frame courante
+        self.prof._spans.append((self.name, threading.get_ident(), self.t0, t1 - self.t0, local.depth))
+        return False
+
+
+class _NullSpan:
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+_NULL = _NullSpan()
+
+
+class Profiler:
+    def __init__(self, frames: int = PROFILE_FRAMES, enabled: bool = False):
+        self.enabled = enabled
+        self._always = enabled  # enregistrement permanent (GAME_PROFILE=1), même sans overlay
+        self.overlay = False
+        self.frames: deque = deque(maxlen=frames)  # (début, fin, spans)
+        self._spans: list = []
+        self._frame_t0 = time.perf_counter()
+        self._local = threading.local()
+        self._threads: dict[int, str] = {}
+        self._under: tuple[pygame.Rect, pygame.Surface] | None = None  # pixels de la scène sous le panneau
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        return _Span(self, name)
+
+    def end_frame(self):
+        """Clôt la frame courante (appelé une fois par tour de boucle, après la présentation)."""
+        now = time.perf_counter()
+        if self.enabled:
+            spans, self._spans = self._spans, []
+            self.frames.append((self._frame_t0, now, spans))
+        self._frame_t0 = now
+
+    def toggle(self):
+        """Overlay on/off ; l'overlay force l'enregistrement."""
+        self.overlay = not self.overlay
+        self.enabled = self.overlay or self._always
+        self._under = None
+        if not self.enabled:
+            self._spans = []
+
+    # ---------- analyse ----------
+    def frame_times(self, n: int | None = None) -> list[float]:
+        frames = list(self.frames)[-n:] if n else self.frames
+        return [(t1 - t0) * 1000.0 for t0, t1, _ in frames]
+
+    def top_spans(self, n: int = OVERLAY_TOP, frames: int | None = None) -> list[tuple[str, float, float]]:
+        """(nom, ms moyen par frame, ms max) des spans les plus coûteux sur les dernières frames."""
+        window = list(self.frames)[-frames:] if frames else list(self.frames)
+        total: dict[str, float] = {}
+        worst: dict[str, float] = {}
+        for _, _, spans in window:
+            for name, _, _, dur, _ in spans:
+                total[name] = total.get(name, 0.0) + dur
+                worst[name] = max(worst.get(name, 0.0), dur)
+        count = max(1, len(window))
+        ranked = sorted(total, key=total.get, reverse=True)[:n]
+        return [(name, total[name] * 1000.0 / count, worst[name] * 1000.0) for name in ranked]
+
+    # ---------- export ----------
+    def export_chrome(self, path: Path | None = None) -> Path:
+        """Écrit le tampon au format Chrome trace-event (JSON) et renvoie le chemin."""
+        if path is None:
+            TRACE_DIR.mkdir(parents=True, exist_ok=True)
+            path = TRACE_DIR / time.strftime("trace-%Y%m%d-%H%M%S.json")
+        pid = os.getpid()
+        main = threading.main_thread().ident
+        names = {main: threading.main_thread().name, **self._threads}
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in names.items()]
+        for i, (t0, t1, spans) in enumerate(self.frames):
+            events.append({"name": f"frame {i}", "cat": "frame", "ph": "X", "pid": pid, "tid": main,
+                           "ts": t0 * 1e6, "dur": (t1 - t0) * 1e6})
+            for name, tid, s0, dur, depth in spans:
+                events.append({"name": name, "cat": "span", "ph": "X", "pid": pid, "tid": tid,
+                               "ts": s0 * 1e6, "dur": dur * 1e6, "args": {"depth": depth}})
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        return path
+
+    # ---------- overlay ----------
+    def restore_under(self, surface: pygame.Surface):
+        """
+        Remet l'image de la scène sous le panneau précédent, avant un draw partiel de la scène :
+        sans cela le panneau semi-transparent se repeint sur lui-même (assombri, texte bavé).
+        """
+        if self._under is not None:
+            rect, under = self._under
+            if surface.get_rect().contains(rect):
+                surface.blit(under, rect)
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect:
+        panel = pygame.Rect(0, 0, 360, 96 + 18 * OVERLAY_TOP)
+        panel.topright = (surface.get_width() - 8, 8)
+        panel = panel.clip(surface.get_rect())
+        self._under = (panel, surface.subsurface(panel).copy())
+        bg = pygame.Surface(panel.size, pygame.SRCALPHA)
+        bg.fill((10, 10, 14, 200))
+        surface.blit(bg, panel)
+
+        times = self.frame_times(OVERLAY_FRAMES)
+        graph = pygame.Rect(panel.x + 8, panel.y + 24, panel.width - 16, 60)
+        scale = graph.height / (2 * FRAME_BUDGET_MS)  # pleine hauteur = 2 budgets
+        bw = graph.width / OVERLAY_FRAMES
+        for i, ms in enumerate(times):
+            h = min(graph.height, int(ms * scale))
+            col = (120, 200, 120) if ms <= FRAME_BUDGET_MS * 1.1 else (230, 90, 70)
+            x = graph.x + int(i * bw)
+            pygame.draw.line(surface, col, (x, graph.bottom), (x, graph.bottom - h))
+        budget_y = graph.bottom - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, (200, 200, 200), (graph.x, budget_y), (graph.right, budget_y))
+
+        if times:
+            s = sorted(times)
+            head = f"frame {times[-1]:5.1f} ms   p95 {s[int(0.95 * (len(s) - 1))]:5.1f}   max {s[-1]:5.1f}"
+        else:
+            head = "frame —"
+        surface.blit(text.render(head, 18, (235, 235, 235)), (panel.x + 8, panel.y + 6))
+        y = graph.bottom + 8
+        for name, mean_ms, max_ms in self.top_spans(frames=OVERLAY_FRAMES):
+            line = f"{mean_ms:6.2f} ms  (max {max_ms:6.1f})  {name}"
+            surface.blit(text.render(line, 18, (220, 220, 220)), (panel.x + 8, y))
+            y += 18
+        return panel
+
+
+PROFILER = Profiler(enabled=os.environ.get("GAME_PROFILE") == "1")
+
+
+def profiled(name: str | None = None):
+    """Décorateur : mesure chaque appel de la fonction sous `name` (défaut : qualname)."""
+    def deco(fn):
+        label = name or fn.__qualname__
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with PROFILER.span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    """Moyenne, p95, p99 et nombre d'échantillons (ms) ; série vide -> zéros."""
+    s = sorted(samples_ms) or [0.0]
+    pick = lambda q: s[min(len(s) - 1, int(q * len(s)))]
+    return {"mean": sum(s) / len(s), "p95": pick(0.95), "p99": pick(0.99), "n": len(samples_ms)}
@@ -0,0 +1,285 @@
+"""
+Enregistrement / rejeu déterministe d'une session.
+- Recorder : flux d'événements passés à SceneManager.handle_event + dt de chaque frame (ms entières,
+  comme Clock.tick), graines aléatoires et état de départ du monde ; empreinte d'état toutes les
+  HASH_EVERY frames
+- play() : réinjecte les frames par le même chemin (handle_event, FixedStep, update, draw),
+  avec ou sans affichage, vérifie les empreintes et mesure les temps de frame
+Format binaire : MAGIC, version, en-tête JSON, puis frames en varints, le tout compressé zlib.
+Frame : tag = 2 * nb_événements + empreinte?, dt (ms), événements, [empreinte 8 octets].
+"""
+import hashlib, io, json, os, random, struct, tempfile, time, zlib
+from pathlib import Path
+import pygame
+
+from .scheduler import FixedStep
+from . import world_map, terrain_cache
+from .world_map import WorldMap
+from .save import SAVES
+from .profiler import summarize
+
+MAGIC = b"KRPL"
+VERSION = 1
+HASH_EVERY = 60  # frames entre deux empreintes d'état (~1 s)
+
+# champs gardés par type d'événement (ceux que lisent les scènes, plus le contexte utile)
+_MOUSE_BUTTON = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+_KEY = (pygame.KEYDOWN, pygame.KEYUP)
+
+
+class ReplayError(Exception):
+    pass
+
+
+# ---------- varints ----------
+def _put(buf: io.BytesIO, n: int):
+    n = (n << 1) ^ (n >> 63)  # zigzag : petits négatifs -> petits positifs
+    while n >= 0x80:
+        buf.write(bytes((n & 0x7F | 0x80,)))
+        n >>= 7
+    buf.write(bytes((n,)))
+
+
+def _get(data: memoryview, i: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        b = data[i]; i += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return (n >> 1) ^ -(n & 1), i
+        shift += 7
+
+
+def _put_bytes(buf: io.BytesIO, b: bytes):
+    _put(buf, len(b))
+    buf.write(b)
+
+
+def _get_bytes(data: memoryview, i: int) -> tuple[bytes, int]:
+    n, i = _get(data, i)
+    return bytes(data[i:i + n]), i + n
+
+
+# ---------- événements ----------
+def _encode_event(buf: io.BytesIO, ev: pygame.event.Event):
+    _put(buf, ev.type)
+    d = ev.dict
+    if ev.type == pygame.MOUSEMOTION:
+        for v in (*d.get("pos", (0, 0)), *d.get("rel", (0, 0))):
+            _put(buf, int(v))
+        b = d.get("buttons", (0, 0, 0))
+        _put(buf, (b[0] & 1) | (b[1] & 1) << 1 | (b[2] & 1) << 2)
+    elif ev.type in _MOUSE_BUTTON:
+        for v in (*d.get("pos", (0, 0)), d.get("button", 1)):
+            _put(buf, int(v))
+    elif ev.type in _KEY:
+        for v in (d.get("key", 0), d.get("mod", 0), d.get("scancode", 0)):
+            _put(buf, int(v))
+        _put_bytes(buf, d.get("unicode", "").encode("utf-8"))
+    else:  # rare (fenêtre, molette...) : attributs simples en JSON
+        simple = {k: v for k, v in d.items() if isinstance(v, (int, float, str, bool, type(None)))}
+        _put_bytes(buf, json.dumps(simple, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode_event(data: memoryview, i: int) -> tuple[pygame.event.Event, int]:
+    etype, i = _get(data, i)
+    if etype == pygame.MOUSEMOTION:
+        v = []
+        for _ in range(5):
+            n, i = _get(data, i); v.append(n)
+        b = v[4]
+        return pygame.event.Event(etype, pos=(v[0], v[1]), rel=(v[2], v[3]),
+                                  buttons=(b & 1, b >> 1 & 1, b >> 2 & 1)), i
+    if etype in _MOUSE_BUTTON:
+        x, i = _get(data, i); y, i = _get(data, i); button, i = _get(data, i)
+        return pygame.event.Event(etype, pos=(x, y), button=button), i
+    if etype in _KEY:
+        key, i = _get(data, i); mod, i = _get(data, i); scancode, i = _get(data, i)
+        uni, i = _get_bytes(data, i)
+        return pygame.event.Event(etype, key=key, mod=mod, scancode=scancode, unicode=uni.decode("utf-8")), i
+    raw, i = _get_bytes(data, i)
+    return pygame.event.Event(etype, json.loads(raw)), i
+
+
+# ---------- empreinte d'état ----------
+def state_hash(mgr) -> bytes:
+    """Empreinte (8 octets) de l'état simulé : pile de scènes, roi, monde, générateur aléatoire."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(" ".join(type(s).__name__ for s in mgr.stack).encode())
+    inv = mgr.game_state.king  # inventaire lu par la boutique et la caserne
+    h.update(repr((inv.resources, inv.equipment, inv.army)).encode())
+    world = next((s for s in mgr.stack if isinstance(s, WorldMap)), None)
+    if world is not None:
+        k = world.king
+        pts = [k.pos, *([k.target] if k.target is not None else []), *k.path]
+        h.update(struct.pack(f"<{2 * len(pts)}d", *(c for p in pts for c in p)))
+        h.update(struct.pack("<3d", world._event_timer, world._castle_cooldown, world._mode_flash_timer))
+        h.update(repr((k.mode, world.selected.name if world.selected else None,
+                       [c.owner for c in world.castles])).encode())
+    h.update(repr(random.getstate()).encode())
+    return h.digest()
+
+
+# ---------- enregistrement ----------
+class Recorder:
+    """
+    À créer au point de synchro : monde généré et courant, aucune entrée traitée.
+    Réinitialise le générateur global avec une graine enregistrée ; la boucle doit repartir
+    d'un FixedStep neuf. Appeler frame() une fois par tour de boucle, close() à la fin.
+    """
+    def __init__(self, path: Path, world: WorldMap, hz: float, seed: int | None = None):
+        self.path = Path(path)
+        self.seed = int.from_bytes(os.urandom(4), "little") if seed is None else seed
+        random.seed(self.seed)  # événements aléatoires de WorldMap.update
+        world.king.snap()
+        header = {
+            "world_seed": world_map.SEED,  # génération (_generate_islets_and_ports : SEED + 2025)
+            "seed": self.seed,
+            "hz": hz,
+            "layout": world.layout(),
+            "king": {"x": world.king.pos.x, "y": world.king.pos.y, "mode": world.king.mode},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("wb")
+        self._file.write(MAGIC + bytes((VERSION,)))
+        raw = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._file.write(struct.pack("<I", len(raw)) + raw)
+        self._z = zlib.compressobj(9)
+        self._pending: tuple | None = None  # (ms, événements) de la dernière frame, écrite au tour suivant ou à close()
+        self.frames = 0
+
+    def frame(self, dt: float, events: list, mgr):
+        """Frame terminée : dt reçu du scheduler, événements passés à handle_event, état après update."""
+        if self._pending is not None:
+            self._write(*self._pending)
+            self._pending = None
+        self.frames += 1
+        digest = state_hash(mgr) if self.frames % HASH_EVERY == 0 else None
+        if digest is not None:
+            self._write(round(dt * 1000), events, digest)
+        else:
+            self._pending = (round(dt * 1000), events)
+
+    def _write(self, ms: int, events: list, digest: bytes | None = None):
+        buf = io.BytesIO()
+        _put(buf, 2 * len(events) + (digest is not None))
+        _put(buf, ms)
+        for ev in events:
+            _encode_event(buf, ev)
+        if digest is not None:
+            buf.write(digest)
+        self._file.write(self._z.compress(buf.getvalue()))
+
+    def close(self, mgr):
+        """Écrit la dernière frame avec l'empreinte de l'état final."""
+        if self._file.closed:
+            return
+        if self._pending is not None:
+            self._write(*self._pending, state_hash(mgr))
+        self._file.write(self._z.flush())
+        self._file.close()
+
+
+# ---------- lecture ----------
+def load(path: Path) -> tuple[dict, list[tuple[float, list, bytes | None]]]:
+    """(en-tête, [(dt, événements, empreinte ou None), ...])."""
+    raw = Path(path).read_bytes()
+    if raw[:4] != MAGIC:
+        raise ReplayError(f"{path} : pas un enregistrement")
+    if raw[4] != VERSION:
+        raise ReplayError(f"{path} : version {raw[4]} non gérée (attendu {VERSION})")
+    (n,) = struct.unpack_from("<I", raw, 5)
+    header = json.loads(raw[9:9 + n].decode("utf-8"))
+    data = memoryview(zlib.decompress(raw[9 + n:]))
+    frames, i = [], 0
+    while i < len(data):
+        tag, i = _get(data, i)
+        ms, i = _get(data, i)
+        events = []
+        for _ in range(tag >> 1):
+            ev, i = _decode_event(data, i)
+            events.append(ev)
+        digest = None
+        if tag & 1:
+            digest, i = bytes(data[i:i + 8]), i + 8
+        frames.append((ms / 1000.0, events, digest))
+    return header, frames
+
+
+# ---------- rejeu ----------
+def play(path: Path, screen: pygame.Surface | None = None, realtime: bool = False, strict: bool = False) -> dict:
+    """
+    Rejoue l'enregistrement ; `screen` None = sans affichage (aucun draw).
+    Renvoie temps de frame (ms : frame, update, draw) et divergences [(frame, attendu, obtenu)].
+    `strict` : ReplayError à la première divergence.
+    """
+    from .scene import SceneManager
+
+    header, frames = load(path)
+    if header["world_seed"] != world_map.SEED:
+        raise ReplayError(f"monde différent : SEED {header['world_seed']} enregistré, {world_map.SEED} ici")
+
+    data_dir = world_map.DATA_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        # état de départ de l'enregistrement ; copie du cache terrain réel (jamais écrit par le rejeu)
+        tmp = Path(tmp)
+        (tmp / "world_map.json").write_text(json.dumps(header["layout"], ensure_ascii=False), encoding="utf-8")
+        terrain_cache.TerrainCache(data_dir / "terrain_cache").copy_to(tmp / "terrain_cache")
+        # toute la session (y compris les sauvegardes) écrit dans la copie, jamais dans data/
+        world_map.DATA_DIR = tmp
+        try:
+            mgr = SceneManager(headless=screen is None)
+            world = WorldMap(mgr)
+            mgr.push(world)  # génération synchrone
+            k = header["king"]
+            world.king.pos.update(k["x"], k["y"])
+            world.king.mode = k["mode"]
+            world.king.snap()
+            random.seed(header["seed"])
+
+            sim = FixedStep(hz=header["hz"])
+            upd, drw, total, diverged = [], [], [], []
+            for n, (dt, events, digest) in enumerate(frames, start=1):
+                t0 = time.perf_counter()
+                if screen is not None:
+                    for ev in pygame.event.get():  # fenêtre réactive ; fermer interrompt le rejeu
+                        if ev.type == pygame.QUIT:
+                            mgr.quit = True
+                if mgr.quit and n < len(frames):
+                    break
+                for ev in events:
+                    mgr.handle_event(ev)
+                t1 = time.perf_counter()
+                for _ in range(sim.advance(dt)):
+                    mgr.update(sim.dt)
+                t2 = time.perf_counter()
+                if screen is not None:
+                    rects = mgr.draw(screen, sim.alpha)
+                    if rects is None:
+                        pygame.display.flip()
+                    elif rects:
+                        pygame.display.update(rects)
+                t3 = time.perf_counter()
+                mgr.end_frame()
+                upd.append((t2 - t1) * 1000.0)
+                drw.append((t3 - t2) * 1000.0)
+                total.append((t3 - t0) * 1000.0)
+                if digest is not None:
+                    got = state_hash(mgr)
+                    if got != digest:
+                        if strict:
+                            raise ReplayError(f"divergence à la frame {n}")
+                        diverged.append((n, digest.hex(), got.hex()))
+                if realtime:
+                    pygame.time.wait(max(0, int(dt * 1000 - (time.perf_counter() - t0) * 1000)))
+        finally:
+            SAVES.flush()  # sauvegardes du rejeu écrites dans le dossier temporaire avant sa suppression
+            world_map.DATA_DIR = data_dir
+    return {
+        "frames": len(total),
+        "recorded": len(frames),
+        "frame": summarize(total),
+        "update": summarize(upd),
+        "draw": summarize(drw),
+        "diverged": diverged,
+    }
@@ -0,0 +1,105 @@
+"""
+Écriture des sauvegardes hors du thread d'affichage.
+- request(chemin, données) : le thread principal ne fait qu'un instantané (dict déjà copié)
+- un thread de fond sérialise et écrit : fichier temporaire + fsync + renommage atomique,
+  un crash pendant l'écriture laisse l'ancienne sauvegarde intacte
+- anti-rebond : les demandes rapprochées (SAVE_DEBOUNCE) sont fusionnées, seule la dernière est écrite
+- on_done : rappelé (thread de fond) seulement une fois le renommage réussi ; en cas d'échec rien
+  n'est marqué sauvegardé, l'appelant redemandera
+- flush() : écrit tout ce qui est en attente et attend la fin (à appeler en quittant)
+"""
+import json, os, threading, time
+from collections.abc import Callable
+from pathlib import Path
+
+SAVE_DEBOUNCE = 0.5  # s sans nouvelle demande avant d'écrire
+FLUSH_TIMEOUT = 5.0  # s max d'attente à la fermeture
+
+
+def write_atomic(path: Path, data: dict):
+    """JSON dans un fichier voisin, fsync, puis remplacement atomique de `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:  # rendre le renommage durable (POSIX ; sans effet ailleurs)
+        fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveWriter:
+    def __init__(self, debounce: float = SAVE_DEBOUNCE):
+        self.debounce = debounce
+        self._cond = threading.Condition()
+        self._pending: dict[Path, tuple[float, dict, Callable | None]] = {}  # chemin -> (instant, données, on_done)
+        self._busy = False      # écriture en cours hors verrou
+        self._flushing = False  # flush() : plus d'anti-rebond
+        self._thread: threading.Thread | None = None
+        self.stats = {"requests": 0, "writes": 0, "coalesced": 0, "errors": 0}
+
+    def request(self, path: Path, data: dict, on_done: Callable[[], None] | None = None):
+        """
+        Programme l'écriture ; `data` ne doit plus être modifié par l'appelant.
+        `on_done` n'est appelé que si ces données sont écrites (pas si une demande plus récente les remplace).
+        """
+        path = Path(path)
+        with self._cond:
+            self.stats["requests"] += 1
+            if path in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending[path] = (time.monotonic(), data, on_done)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                while not self._flushing:
+                    last = max(t for t, _, _ in self._pending.values())
+                    left = last + self.debounce - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cond.wait(left)
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            writes = errors = 0
+            for path, (_, data, on_done) in batch.items():
+                try:
+                    write_atomic(path, data)
+                except (OSError, TypeError, ValueError) as exc:
+                    errors += 1
+                    print(f"[save] échec de l'écriture de {path} : {exc}")
+                    continue
+                writes += 1
+                if on_done is not None:
+                    on_done()
+            with self._cond:
+                self.stats["writes"] += writes
+                self.stats["errors"] += errors
+                self._busy = False
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """Écrit immédiatement les demandes en attente ; False si le délai est dépassé."""
+        with self._cond:
+            self._flushing = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+            self._flushing = False
+        return done
+
+
+SAVES = SaveWriter()
@@ -1,22 +1,45 @@
 import pygame
 from .entities import King
+from .profiler import PROFILER
 
 class Scene:
+    """
+    draw() peut renvoyer la liste des rectangles modifiés à l'écran (vide : rien n'a changé).
+    None (défaut) signifie que tout l'écran a été redessiné.
+    Une scène qui redessine partiellement doit tout repeindre quand `_redraw` est vrai.
+    `animating` faux : rien ne bouge sans entrée, la boucle peut dormir (voir FrameScheduler) ;
+    `idle_fps` > 0 : cadence réduite conservée au repos (animations d'ambiance).
+    """
+    idle_fps = 0.0
+
     def __init__(self, mgr):
         self.mgr = mgr
+        self._redraw = True
     # Hooks optionnels
     def on_enter(self): pass
     def on_exit(self): pass
     def on_child_popped(self, child): pass  # appelé quand une scène enfant se ferme
     def handle_event(self, event): pass
     def update(self, dt: float): pass
-    def draw(self, surface: pygame.Surface): pass
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None: pass
+
+    @property
+    def animating(self) -> bool:
+        return True
+
+    def invalidate(self):
+        """L'écran ne contient plus l'image de cette scène : tout repeindre au prochain draw."""
+        self._redraw = True
 
 class SceneManager:
-    def __init__(self):
+    def __init__(self, headless: bool = False):
         self.stack: list[Scene] = []
+        self.headless = headless  # simulation sans affichage (sim.py) : aucun travail de rendu dans update
         self.quit = False
         self.game_state = GameState()  # État global du jeu avec le roi
+        self._changed = True  # scène courante changée depuis le dernier draw -> flip complet
+        self.profiler = PROFILER
+        self.alpha = 1.0  # fraction de pas de simulation écoulée, pour l'interpolation au rendu
 
     @property
     def current(self) -> Scene | None:
@@ -24,8 +47,15 @@ class SceneManager:
 
     def push(self, scene: Scene):
         self.stack.append(scene)
+        self._changed = True
         scene.on_enter()
 
+    def replace(self, scene: Scene):
+        """Remplace la scène courante (sans notifier la scène du dessous)."""
+        if self.stack:
+            self.stack.pop().on_exit()
+        self.push(scene)
+
     def pop(self):
         if not self.stack:
             return
@@ -33,24 +63,59 @@ class SceneManager:
         child.on_exit()
         # informer la scène du dessous
         parent = self.current
+        self._changed = True
         if parent:
+            parent.invalidate()
             parent.on_child_popped(child)
 
+    def invalidate(self):
+        """Écran à reconstruire entièrement (fenêtre exposée, redimensionnée...)."""
+        self._changed = True
+
     # IMPORTANT: ne délègue qu'à la scène **courante**
     def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle()
+            self.invalidate()  # effacer / afficher l'overlay
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and self.profiler.frames:
+            print(f"[profil] trace écrite : {self.profiler.export_chrome()}")
+            return
         cur = self.current
         if cur:
-            cur.handle_event(event)
+            with self.profiler.span(f"{type(cur).__name__}.handle_event"):
+                cur.handle_event(event)
 
     def update(self, dt: float):
         cur = self.current
         if cur:
-            cur.update(dt)
+            with self.profiler.span(f"{type(cur).__name__}.update"):
+                cur.update(dt)
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect] | None:
+        """Rectangles à présenter avec pygame.display.update, ou None pour un flip complet."""
+        self.alpha = alpha
         cur = self.current
-        if cur:
-            cur.draw(surface)
+        if cur is None:
+            return []
+        if self._changed:
+            cur.invalidate()
+        elif self.profiler.overlay:
+            self.profiler.restore_under(surface)  # la scène ne repeint que ce qui a changé
+        with self.profiler.span(f"{type(cur).__name__}.draw"):
+            rects = cur.draw(surface)
+        if self.profiler.overlay:
+            panel = self.profiler.draw_overlay(surface)
+            if rects is not None:
+                rects = [*rects, panel]
+        if self._changed:
+            self._changed = False
+            return None
+        return rects
+
+    def end_frame(self):
+        """Fin d'un tour de boucle (après la présentation) : borne de frame pour le profileur."""
+        self.profiler.end_frame()
 
 class GameState:
     def __init__(self):
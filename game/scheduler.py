@@ -0,0 +1,62 @@
+"""
+Cadence de la boucle principale : FPS plein tant que la scène courante anime,
+sinon attente bloquante sur pygame.event.wait (réveil immédiat sur une entrée),
+avec un délai de 1/idle_fps si la scène garde une animation d'ambiance.
+FixedStep découpe le temps écoulé en pas de simulation fixes (accumulateur).
+"""
+import pygame
+from settings import FPS, SIM_HZ, MAX_SIM_STEPS
+
+MAX_IDLE_DT = 0.25  # s : borne du dt rendu après une attente (pas de saut de simulation)
+STEP_EPS = 1e-9     # fraction de pas : dérive d'arrondi de l'accumulateur, comptée comme un pas entier
+
+
+class FrameScheduler:
+    def __init__(self, fps: int = FPS):
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.idle = False  # dernière frame passée en attente
+
+    def next_frame(self, scene) -> tuple[list, float]:
+        """Attend la prochaine frame ; renvoie (événements, dt en secondes)."""
+        if scene is None or scene.animating:
+            self.idle = False
+            dt = self.clock.tick(self.fps) / 1000.0
+            return pygame.event.get(), dt
+        self.idle = True
+        timeout = int(1000 / scene.idle_fps) if scene.idle_fps > 0 else 0
+        first = pygame.event.wait(timeout) if timeout else pygame.event.wait()
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events += pygame.event.get()
+        dt = min(self.clock.tick() / 1000.0, MAX_IDLE_DT)
+        return events, dt
+
+
+class FixedStep:
+    """
+    Accumulateur à pas fixe : la simulation avance toujours de `dt`, indépendamment du rendu.
+    Au-delà de `max_steps` pas par frame, le retard est abandonné (pas de spirale de la mort) :
+    le jeu ralentit au lieu de geler.
+    """
+    def __init__(self, hz: float = SIM_HZ, max_steps: int = MAX_SIM_STEPS):
+        self.dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.acc = 0.0
+        self.dropped = 0.0  # s de simulation abandonnées (diagnostic)
+
+    def advance(self, frame_dt: float) -> int:
+        """Ajoute le temps de la frame ; renvoie le nombre de pas de simulation à exécuter."""
+        self.acc += frame_dt
+        steps = int(self.acc / self.dt + STEP_EPS)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+            self.acc = self.acc % self.dt
+        else:
+            self.acc = max(0.0, self.acc - steps * self.dt)
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction du pas suivant déjà écoulée (0..1), pour interpoler le rendu."""
+        return min(1.0, self.acc / self.dt)
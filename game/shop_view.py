@@ -1,10 +1,9 @@
+import itertools
 import pygame
 from settings import WIDTH, HEIGHT, COLOR_UI
 from .scene import Scene
-from .entities import EQUIPMENTS
-
-def _font(sz:int)->pygame.font.Font:
-    return pygame.font.Font(None, sz)
+from . import text
+from .entities import EQUIPMENTS, catalog_icon, catalog_visible
 
 class ShopView(Scene):
     """
@@ -17,11 +16,10 @@ class ShopView(Scene):
         super().__init__(mgr)
         self.castle = castle
         self.king = mgr.game_state.king
-        self.font_big = _font(36)
-        self.font = _font(24)
         self.t = 0.0
         self.icon_size = 40
         self.spacing = 60
+        self._drawn = None  # état affiché : écran statique tant qu'il ne change pas
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -45,39 +43,43 @@ class ShopView(Scene):
                         pass  # Vente déjà gérée dans sell_equipment
                     return
 
+    @property
+    def animating(self) -> bool:
+        return False  # écran fixe entre deux clics
+
     def update(self, dt: float):
         self.t += dt
 
     def draw(self, surface: pygame.Surface):
+        state = (self.king.resources["gold"], tuple(self.king.equipment.items()))
+        if not self._redraw and state == self._drawn:
+            return []
+        self._redraw, self._drawn = False, state
         surface.fill((30, 30, 36))
-        title = self.font_big.render(f"Boutique — {self.castle.name}", True, COLOR_UI)
+        title = text.render(f"Boutique — {self.castle.name}", 36, COLOR_UI)
         surface.blit(title, (WIDTH//2 - title.get_width()//2, 40))
 
         # Ressources du roi
-        gold_text = self.font.render(f"Or: {self.king.resources['gold']}", True, COLOR_UI)
+        gold_text = text.render(f"Or: {self.king.resources['gold']}", 24, COLOR_UI)
         surface.blit(gold_text, (50, 80))
 
         # Ligne haut : Items à acheter
-        buy_text = self.font.render("À acheter (cliquez sur l'icône) :", True, COLOR_UI)
+        buy_text = text.render("À acheter (cliquez sur l'icône) :", 24, COLOR_UI)
         surface.blit(buy_text, (50, 100))
-        for i, item_name in enumerate(EQUIPMENTS):
+        for i, item_name in enumerate(itertools.islice(EQUIPMENTS, catalog_visible(self.spacing))):
             item = EQUIPMENTS[item_name]
-            icon_surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
-            item["icon_func"](icon_surf, (self.icon_size//2, self.icon_size//2))
-            surface.blit(icon_surf, (50 + i * self.spacing, 120))
-            price_text = self.font.render(f"{item['price']} or", True, COLOR_UI)
+            surface.blit(catalog_icon(EQUIPMENTS, item_name, self.icon_size), (50 + i * self.spacing, 120))
+            price_text = text.render(f"{item['price']} or", 24, COLOR_UI)
             surface.blit(price_text, (50 + i * self.spacing, 120 + self.icon_size + 5))
 
         # Ligne bas : Inventaire du roi (à vendre)
-        sell_text = self.font.render("Votre inventaire (cliquez sur l'icône pour vendre) :", True, COLOR_UI)
+        sell_text = text.render("Votre inventaire (cliquez sur l'icône pour vendre) :", 24, COLOR_UI)
         surface.blit(sell_text, (50, HEIGHT - 120 - self.icon_size - 20))
-        for i, (item_name, qty) in enumerate(self.king.equipment.items()):
-            item = EQUIPMENTS[item_name]
-            icon_surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
-            item["icon_func"](icon_surf, (self.icon_size//2, self.icon_size//2))
-            surface.blit(icon_surf, (50 + i * self.spacing, HEIGHT - 120 - self.icon_size))
-            qty_text = self.font.render(f"x{qty}", True, COLOR_UI)
+        for i, (item_name, qty) in enumerate(itertools.islice(self.king.equipment.items(), catalog_visible(self.spacing))):
+            surface.blit(catalog_icon(EQUIPMENTS, item_name, self.icon_size), (50 + i * self.spacing, HEIGHT - 120 - self.icon_size))
+            qty_text = text.render(f"x{qty}", 24, COLOR_UI)
             surface.blit(qty_text, (50 + i * self.spacing + self.icon_size - 20, HEIGHT - 120 - self.icon_size + self.icon_size - 20))
 
-        help_ = self.font.render("[ESC] Retour", True, COLOR_UI)
+        help_ = text.render("[ESC] Retour", 24, COLOR_UI)
         surface.blit(help_, (20, HEIGHT-36))
+        return [surface.get_rect()]
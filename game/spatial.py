@@ -0,0 +1,105 @@
+"""
+Index spatial en grille uniforme pour les entités de la carte (châteaux, ports...).
+Chaque objet est un disque (x, y, r) inscrit dans toutes les cellules que touche sa boîte.
+Les résultats respectent l'ordre d'insertion (même priorité que l'ancien parcours de liste).
+"""
+import pygame
+
+CELL_SIZE = 128
+
+
+class SpatialGrid:
+    def __init__(self, cell: int = CELL_SIZE):
+        self.cell = cell
+        self._cells: dict[tuple[int, int], list] = {}
+        self._entries: dict[int, tuple] = {}  # id(obj) -> (seq, obj, x, y, r, clés)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._entries
+
+    def _keys(self, x0: float, y0: float, x1: float, y1: float):
+        c = self.cell
+        return [(i, j) for j in range(int(y0 // c), int(y1 // c) + 1)
+                       for i in range(int(x0 // c), int(x1 // c) + 1)]
+
+    # ---------- mises à jour ----------
+    def insert(self, obj, x: float, y: float, r: float = 0.0):
+        if id(obj) in self._entries:
+            self.move(obj, x, y, r)
+            return
+        keys = self._keys(x - r, y - r, x + r, y + r)
+        self._entries[id(obj)] = (self._seq, obj, x, y, r, keys)
+        self._seq += 1
+        for k in keys:
+            self._cells.setdefault(k, []).append(obj)
+
+    def remove(self, obj):
+        entry = self._entries.pop(id(obj), None)
+        if entry is None:
+            return
+        for k in entry[5]:
+            bucket = self._cells[k]
+            bucket.remove(obj)
+            if not bucket:
+                del self._cells[k]
+
+    def move(self, obj, x: float, y: float, r: float | None = None):
+        """Met à jour la position (et le rayon) ; ne touche que les cellules qui changent."""
+        seq, _, _, _, old_r, old_keys = self._entries[id(obj)]
+        r = old_r if r is None else r
+        keys = self._keys(x - r, y - r, x + r, y + r)
+        if keys != old_keys:
+            for k in set(old_keys) - set(keys):
+                bucket = self._cells[k]
+                bucket.remove(obj)
+                if not bucket:
+                    del self._cells[k]
+            for k in set(keys) - set(old_keys):
+                self._cells.setdefault(k, []).append(obj)
+        self._entries[id(obj)] = (seq, obj, x, y, r, keys)
+
+    def update(self, obj):
+        """Relit obj.pos / obj.radius après une modification externe."""
+        self.move(obj, obj.pos.x, obj.pos.y, getattr(obj, "radius", 0.0))
+
+    # ---------- requêtes ----------
+    def _candidates(self, x0, y0, x1, y1):
+        seen = {}
+        for k in self._keys(x0, y0, x1, y1):
+            for obj in self._cells.get(k, ()):
+                seen[id(obj)] = self._entries[id(obj)]
+        return sorted(seen.values(), key=lambda e: e[0])
+
+    def query_point(self, x: float, y: float) -> list:
+        """Objets dont le disque contient (x, y)."""
+        return [e[1] for e in self._candidates(x, y, x, y)
+                if (e[2] - x) ** 2 + (e[3] - y) ** 2 <= e[4] ** 2]
+
+    def query_radius(self, x: float, y: float, radius: float, strict: bool = False) -> list:
+        """Objets dont le centre est à distance <= radius (< si strict) de (x, y)."""
+        r2 = radius * radius
+        out = []
+        for e in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            d2 = (e[2] - x) ** 2 + (e[3] - y) ** 2
+            if d2 < r2 or (not strict and d2 == r2):
+                out.append(e[1])
+        return out
+
+    def query_rect(self, rect: pygame.Rect) -> list:
+        """Objets dont le disque touche le rectangle."""
+        out = []
+        for e in self._candidates(rect.left, rect.top, rect.right, rect.bottom):
+            _, obj, x, y, r, _ = e
+            nx = min(max(x, rect.left), rect.right)
+            ny = min(max(y, rect.top), rect.bottom)
+            if (x - nx) ** 2 + (y - ny) ** 2 <= r * r:
+                out.append(obj)
+        return out
+
+    def any_within(self, x: float, y: float, radius: float) -> bool:
+        """Vrai si un centre est strictement à moins de `radius` (tests d'espacement)."""
+        return bool(self.query_radius(x, y, radius, strict=True))
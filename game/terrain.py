@@ -0,0 +1,209 @@
+"""
+Moteur de terrain vectorisé (NumPy).
+Reprend exactement les formules scalaires de world_map (hash, value noise, fbm,
+masque d'île, éclairage, classification) mais sur des tableaux de coordonnées entiers.
+"""
+import multiprocessing, os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pygame
+
+from settings import (
+    COLOR_WATER_DEEP, COLOR_WATER_SHALLOW, COLOR_SAND, COLOR_GRASS, COLOR_HILL, COLOR_MOUNTAIN
+)
+
+# Classes de terrain (index dans PALETTE) ; < CLASS_SAND => eau
+CLASS_WATER_DEEP, CLASS_WATER_SHALLOW, CLASS_SAND, CLASS_GRASS, CLASS_HILL, CLASS_MOUNTAIN = range(6)
+CLASS_BOUNDS = np.array([0.35, 0.40, 0.45, 0.75, 0.90])
+PALETTE = np.array([COLOR_WATER_DEEP, COLOR_WATER_SHALLOW, COLOR_SAND,
+                    COLOR_GRASS, COLOR_HILL, COLOR_MOUNTAIN], dtype=np.uint8)
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+# ----- bruit (mêmes constantes que la version scalaire) -----
+def hash2(ix, iy, seed: int):
+    # arithmétique uint64 modulo 2^64 : les 48 bits bas utiles restent exacts
+    ix = np.asarray(ix, dtype=np.int64).astype(np.uint64)
+    iy = np.asarray(iy, dtype=np.int64).astype(np.uint64)
+    n = (ix * np.uint64(374761393)) ^ (iy * np.uint64(668265263)) ^ np.uint64((seed * 1442695041) & 0xFFFFFFFFFFFFFFFF)
+    n = (n ^ (n >> np.uint64(13))) * np.uint64(1274126177)
+    n = n ^ (n >> np.uint64(16))
+    return (n & _MASK32).astype(np.float64) / 0xFFFFFFFF
+
+def smoothstep(t):
+    return t * t * (3 - 2 * t)
+
+def value_noise(x, y, freq, seed: int):
+    x = x * freq; y = y * freq
+    ix, iy = x.astype(np.int64), y.astype(np.int64)  # troncature, comme int()
+    fx, fy = x - ix, y - iy
+    # le réseau est minuscule (quelques cellules) : on hache chaque sommet une seule fois
+    # puis on indexe, au lieu de hacher 4 fois par point
+    x0, y0 = int(ix.min(initial=0)), int(iy.min(initial=0))
+    gx = np.arange(x0, int(ix.max(initial=0)) + 2)
+    gy = np.arange(y0, int(iy.max(initial=0)) + 2)
+    lattice = hash2(gx[None, :], gy[:, None], seed)
+    ix, iy = ix - x0, iy - y0
+    v00 = lattice[iy,   ix]
+    v10 = lattice[iy,   ix+1]
+    v01 = lattice[iy+1, ix]
+    v11 = lattice[iy+1, ix+1]
+    ux, uy = smoothstep(fx), smoothstep(fy)
+    a = v00 + (v10 - v00) * ux
+    b = v01 + (v11 - v01) * ux
+    return a + (b - a) * uy
+
+def fbm(x, y, seed: int):
+    return (
+        0.55 * value_noise(x, y, 1.2, seed) +
+        0.30 * value_noise(x, y, 3.1, seed+11) +
+        0.15 * value_noise(x, y, 6.4, seed+29)
+    )
+
+def island_mask(nx, ny):
+    dx = nx - 0.5
+    dy = ny - 0.5
+    r = np.hypot(dx, dy) / 0.7071
+    falloff = 1.0 - (r**1.6)
+    return np.clip(falloff, 0.0, 1.0)
+
+def height(nx, ny, seed: int):
+    """Hauteur normalisée [0,1] pour des coordonnées normalisées (broadcast NumPy)."""
+    nx = np.asarray(nx, dtype=np.float64)
+    ny = np.asarray(ny, dtype=np.float64)
+    v = fbm(nx, ny, seed)
+    v = v * (0.75 + 0.25 * island_mask(nx, ny))  # île centrale
+    light = 0.08 * (1 - (nx + (1 - ny)) / 2)
+    return np.clip(v + light, 0.0, 1.0)
+
+def classify(v):
+    """Index de classe (uint8) par seuil, identique à world_map._classify."""
+    return np.digitize(v, CLASS_BOUNDS).astype(np.uint8)
+
+
+# ----- rasterisation -----
+PARALLEL_MIN_CELLS = 2_500_000  # en dessous, le démarrage du pool (spawn, ~0,3 s) dépasse le gain
+
+def height_grid(w: int, h: int, seed: int, y0: int = 0, y1: int | None = None,
+                step: int = 1, norm: tuple[int, int] | None = None, x0: int = 0, x1: int | None = None):
+    """
+    Grille des hauteurs aux points (x*step, y*step), normalisés par norm=(W, H) (défaut (w, h)).
+    [y0, y1) x [x0, x1) ne calcule qu'une bande ou une tuile : chaque point étant indépendant,
+    les morceaux recollés sont identiques octet pour octet à la grille entière.
+    """
+    y1 = h if y1 is None else y1
+    x1 = w if x1 is None else x1
+    norm_w, norm_h = norm or (w, h)
+    nx = (np.arange(x0, x1, dtype=np.float64) * step / norm_w)[None, :]
+    ny = (np.arange(y0, y1, dtype=np.float64) * step / norm_h)[:, None]
+    return height(nx, ny, seed)
+
+def _sample_band(args):
+    # exécuté dans un processus du pool : ne renvoie que des tableaux compacts
+    w, h, seed, y0, y1, step, norm = args
+    v = height_grid(w, h, seed, y0, y1, step, norm)
+    return classify(v), v.astype(np.float16)
+
+def resolve_workers(workers: int | None) -> int:
+    """0/None -> un processus par cœur."""
+    return max(1, workers or os.cpu_count() or 1)
+
+def sample_terrain(w: int, h: int, seed: int, step: int = 1, norm: tuple[int, int] | None = None,
+                   workers: int | None = 1):
+    """
+    (classes uint8, hauteurs float16) d'une grille (h, w). Avec workers > 1 les lignes sont
+    découpées en bandes calculées dans un ProcessPoolExecutor puis recollées.
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1 or w * h < PARALLEL_MIN_CELLS:
+        return _sample_band((w, h, seed, 0, h, step, norm))
+    n_bands = min(h, workers * 4)  # quelques bandes par cœur pour lisser la charge
+    cuts = [h * i // n_bands for i in range(n_bands + 1)]
+    jobs = [(w, h, seed, y0, y1, step, norm) for y0, y1 in zip(cuts, cuts[1:]) if y1 > y0]
+    # spawn : appelé depuis le thread de chargement (LoadingView) pendant que SDL tourne ; un fork
+    # d'un processus multi-thread peut bloquer les enfants sur un verrou pris au moment du fork
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        bands = list(pool.map(_sample_band, jobs))
+    return np.vstack([c for c, _ in bands]), np.vstack([v for _, v in bands])
+
+def class_grid(w: int, h: int, seed: int, workers: int | None = 1):
+    return sample_terrain(w, h, seed, workers=workers)[0]
+
+def classes_to_surface(classes) -> pygame.Surface:
+    """Grille de classes (h, w) -> Surface RGB en une seule écriture surfarray."""
+    h, w = classes.shape
+    surf = pygame.Surface((w, h))
+    pygame.surfarray.blit_array(surf, PALETTE[classes].transpose(1, 0, 2))
+    return surf
+
+def render_terrain(w: int, h: int, seed: int, workers: int | None = 1) -> pygame.Surface:
+    return classes_to_surface(class_grid(w, h, seed, workers))
+
+
+# ----- champ de terrain précalculé (requêtes O(1)) -----
+class TerrainField:
+    """
+    Hauteur (float16) et classe (uint8) échantillonnées une seule fois tous les `cell` px du monde.
+    La cellule (i, j) porte la valeur du point monde (i*cell, j*cell) : avec cell=1 les requêtes
+    aux coordonnées entières sont exactement celles de l'ancien calcul à la volée.
+    """
+    def __init__(self, world_w: int, world_h: int, seed: int, cell: int = 1, workers: int | None = 1):
+        self.world_w, self.world_h = world_w, world_h
+        self.seed = seed
+        self.cell = max(1, int(cell))
+        gw = -(-world_w // self.cell)
+        gh = -(-world_h // self.cell)
+        # classes calculées avant l'arrondi float16
+        self.classes, self.height = sample_terrain(gw, gh, seed, step=self.cell,
+                                                   norm=(world_w, world_h), workers=workers)
+        self.water = self.classes < CLASS_SAND
+
+    @classmethod
+    def from_grids(cls, world_w: int, world_h: int, seed: int, cell: int, height, classes):
+        """Reconstruit un champ depuis des grilles déjà calculées (cache disque, mmap accepté)."""
+        field = cls.__new__(cls)
+        field.world_w, field.world_h = world_w, world_h
+        field.seed = seed
+        field.cell = cell
+        field.classes = classes
+        field.height = height
+        field.water = np.asarray(classes) < CLASS_SAND
+        return field
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.classes.shape
+
+    def _cell(self, x, y):
+        gh, gw = self.classes.shape
+        i = min(max(int(x) // self.cell, 0), gw - 1)
+        j = min(max(int(y) // self.cell, 0), gh - 1)
+        return i, j
+
+    def _cells(self, xs, ys):
+        gh, gw = self.classes.shape
+        i = np.clip(np.asarray(xs).astype(np.int64) // self.cell, 0, gw - 1)
+        j = np.clip(np.asarray(ys).astype(np.int64) // self.cell, 0, gh - 1)
+        return i, j
+
+    # --- requêtes ponctuelles ---
+    def is_water(self, x, y) -> bool:
+        i, j = self._cell(x, y)
+        return bool(self.water[j, i])
+
+    def height_at(self, x, y) -> float:
+        i, j = self._cell(x, y)
+        return float(self.height[j, i])
+
+    def class_at(self, x, y) -> int:
+        i, j = self._cell(x, y)
+        return int(self.classes[j, i])
+
+    # --- requêtes par lots (tableaux de points -> tableaux de booléens) ---
+    def is_water_many(self, xs, ys):
+        i, j = self._cells(xs, ys)
+        return self.water[j, i]
+
+    def is_land_many(self, xs, ys):
+        return ~self.is_water_many(xs, ys)
@@ -0,0 +1,72 @@
+"""
+Cache disque du terrain généré (fond, grilles hauteur/classe, masque des îlots, ports/îlots).
+Une entrée = un dossier data/terrain_cache/<clé>/ de fichiers .npy (mappables en mémoire)
++ un petit layout.json. La clé hache les paramètres ET le code de génération : toute
+modification d'une constante invalide le cache automatiquement.
+"""
+import hashlib, inspect, json, os, shutil
+from pathlib import Path
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def make_key(params: dict, *code) -> str:
+    h = hashlib.sha1()
+    h.update(json.dumps({"format": FORMAT_VERSION, **params}, sort_keys=True).encode("utf-8"))
+    for obj in code:
+        try:
+            src = inspect.getsource(obj)
+        except (OSError, TypeError):
+            src = getattr(obj, "__qualname__", repr(obj))
+        h.update(src.encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+class TerrainCache:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def load(self, key: str) -> dict | None:
+        """Tableaux en lecture seule (mmap) + 'layout', ou None si absent/illisible."""
+        d = self.root / key
+        try:
+            layout = json.loads((d / "layout.json").read_text(encoding="utf-8"))
+            arrays = {name: np.load(d / f"{name}.npy", mmap_mode="r") for name in layout["arrays"]}
+        except (OSError, ValueError, KeyError):
+            return None
+        return {"layout": layout, **arrays}
+
+    def store(self, key: str, arrays: dict, layout: dict):
+        """Écrit dans un dossier temporaire puis renomme (jamais d'entrée à moitié écrite)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        for name, arr in arrays.items():
+            np.save(tmp / f"{name}.npy", np.ascontiguousarray(arr))
+        layout = {**layout, "arrays": sorted(arrays)}
+        (tmp / "layout.json").write_text(json.dumps(layout, ensure_ascii=False), encoding="utf-8")
+        final = self.root / key
+        shutil.rmtree(final, ignore_errors=True)
+        os.replace(tmp, final)
+        self._prune(keep=key)
+
+    def copy_to(self, root: Path) -> "TerrainCache":
+        """
+        Copie les entrées dans `root` (dossier de données jetable : simulation, rejeu, tests) :
+        ce qui y est ensuite généré ou élagué ne touche jamais ce cache-ci.
+        """
+        dst = TerrainCache(root)
+        dst.root.mkdir(parents=True, exist_ok=True)
+        if self.root.is_dir():
+            for d in self.root.iterdir():
+                if d.is_dir() and not d.name.startswith(".") and not (dst.root / d.name).exists():
+                    shutil.copytree(d, dst.root / d.name)
+        return dst
+
+    def _prune(self, keep: str):
+        # une seule génération valide à la fois : les anciennes clés sont obsolètes
+        for d in self.root.iterdir():
+            if d.is_dir() and d.name != keep and not d.name.startswith("."):
+                shutil.rmtree(d, ignore_errors=True)
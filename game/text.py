@@ -0,0 +1,54 @@
+"""
+Service de texte partagé par toutes les scènes.
+- polices mises en cache par (nom, taille)
+- rendus (texte, taille, couleur, antialias) dans un cache LRU borné en octets
+Les surfaces rendues sont partagées : ne jamais dessiner dedans.
+"""
+from collections import OrderedDict
+import pygame
+
+TEXT_BUDGET_BYTES = 8 * 1024 * 1024  # ~8 Mo de labels rendus
+
+_fonts: dict[tuple, pygame.font.Font] = {}
+_labels: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+
+def get_font(size: int, name: str | None = None) -> pygame.font.Font:
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, size)
+    return font
+
+
+def _nbytes(surf: pygame.Surface) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+def render(text: str, size: int, color, antialias: bool = True, name: str | None = None) -> pygame.Surface:
+    key = (text, size, tuple(color), antialias, name)
+    surf = _labels.get(key)
+    if surf is not None:
+        _labels.move_to_end(key)
+        _stats["hits"] += 1
+        return surf
+    _stats["misses"] += 1
+    surf = _labels[key] = get_font(size, name).render(text, antialias, color)
+    _stats["bytes"] += _nbytes(surf)
+    while _stats["bytes"] > TEXT_BUDGET_BYTES and len(_labels) > 1:
+        _, old = _labels.popitem(last=False)
+        _stats["bytes"] -= _nbytes(old)
+        _stats["evictions"] += 1
+    return surf
+
+
+def stats() -> dict:
+    """Compteurs du cache : hits, misses, evictions, bytes, entries, hit_rate."""
+    total = _stats["hits"] + _stats["misses"]
+    return {**_stats, "entries": len(_labels), "hit_rate": _stats["hits"] / total if total else 0.0}
+
+
+def clear():
+    _labels.clear()
+    _stats.update(hits=0, misses=0, evictions=0, bytes=0)
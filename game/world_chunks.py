@@ -0,0 +1,153 @@
+"""
+Fond de carte découpé en tuiles (chunks) générées à la demande autour de la caméra.
+Les tuiles vivent dans un cache LRU borné en octets : la mémoire suit la taille de la vue,
+pas la surface du monde.
+"""
+import math
+from collections import OrderedDict
+import numpy as np
+import pygame
+
+from . import terrain
+from .profiler import profiled
+from settings import COLOR_SAND, COLOR_GRASS
+
+CHUNK_SIZE = 512                        # px monde par côté de tuile
+CHUNK_BUDGET_BYTES = 24 * 1024 * 1024   # ~24 tuiles 512x512 en 32 bits
+PREFETCH_MARGIN = 256                   # px autour de la vue préparés à l'avance
+PREFETCH_PER_FRAME = 1                  # tuiles hors écran générées par frame au maximum
+BORDER = 6                              # bordure douce sur les bords du monde
+
+
+class WorldChunks:
+    def __init__(self, world_w: int, world_h: int, seed: int, scale: int,
+                 chunk: int = CHUNK_SIZE, budget: int = CHUNK_BUDGET_BYTES):
+        self.world_w, self.world_h = world_w, world_h
+        self.seed = seed
+        self.low_w, self.low_h = max(1, world_w // scale), max(1, world_h // scale)
+        self.chunk = chunk
+        self.budget = budget
+        self.cols = -(-world_w // chunk)
+        self.rows = -(-world_h // chunk)
+        self.islets: list[tuple[list, list]] = []  # (contour, intérieur) en coords monde
+        self._tiles: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._raw: set[tuple[int, int]] = set()  # tuiles pas encore converties au format écran
+        self.bytes = 0
+
+    # ---------- îlots ----------
+    def add_islet(self, poly, inner):
+        self.islets.append((poly, inner))
+        for key in self._keys_in_rect(self._poly_bbox(poly)):
+            self._drop(key)
+
+    # ---------- tuiles ----------
+    def _keys_in_rect(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        c = self.chunk
+        i0 = max(0, rect.left // c); i1 = min(self.cols - 1, (rect.right - 1) // c)
+        j0 = max(0, rect.top // c);  j1 = min(self.rows - 1, (rect.bottom - 1) // c)
+        return [(i, j) for j in range(j0, j1 + 1) for i in range(i0, i1 + 1)]
+
+    def _tile_rect(self, i: int, j: int) -> pygame.Rect:
+        x0, y0 = i * self.chunk, j * self.chunk
+        return pygame.Rect(x0, y0, min(self.chunk, self.world_w - x0), min(self.chunk, self.world_h - y0))
+
+    @staticmethod
+    def _axis(p0: int, n: int, world: int, low: int):
+        # échantillonnage bilinéaire centré pixel, invariant par translation (pas de couture)
+        u = (np.arange(p0, p0 + n, dtype=np.float64) + 0.5) * low / world - 0.5
+        f = np.floor(u)
+        i0 = np.clip(f, 0, low - 1).astype(np.int64)
+        i1 = np.clip(f + 1, 0, low - 1).astype(np.int64)
+        return i0, i1, (u - f).astype(np.float32)
+
+    @profiled()
+    def _render(self, i: int, j: int) -> pygame.Surface:
+        r = self._tile_rect(i, j)
+        ix0, ix1, fx = self._axis(r.x, r.w, self.world_w, self.low_w)
+        iy0, iy1, fy = self._axis(r.y, r.h, self.world_h, self.low_h)
+        lx, ly = int(ix0.min()), int(iy0.min())
+        heights = terrain.height_grid(self.low_w, self.low_h, self.seed,
+                                      ly, int(iy1.max()) + 1, x0=lx, x1=int(ix1.max()) + 1)
+        rgb = terrain.PALETTE[terrain.classify(heights)].astype(np.float32)
+        row = rgb[:, ix0 - lx] * (1 - fx)[None, :, None] + rgb[:, ix1 - lx] * fx[None, :, None]
+        img = row[iy0 - ly] * (1 - fy)[:, None, None] + row[iy1 - ly] * fy[:, None, None]
+        tile = pygame.Surface(r.size)
+        pygame.surfarray.blit_array(tile, (img + 0.5).astype(np.uint8).transpose(1, 0, 2))
+
+        # bordure douce (seulement les tuiles au bord du monde)
+        world = pygame.Rect(-r.x, -r.y, self.world_w, self.world_h)
+        if not world.inflate(-2 * BORDER, -2 * BORDER).contains(tile.get_rect()):
+            overlay = pygame.Surface(r.size, pygame.SRCALPHA)
+            for c in range(BORDER):
+                alpha = 18 - c*3
+                pygame.draw.rect(overlay, (0,0,0,alpha), world, width=1+c)
+            tile.blit(overlay, (0,0))
+
+        # îlots (même ordre de dessin que sur la carte complète)
+        for poly, inner in self.islets:
+            if not self._poly_bbox(poly).colliderect(r):
+                continue
+            pts = [(int(px) - r.x, int(py) - r.y) for px, py in poly]
+            pygame.draw.polygon(tile, COLOR_SAND, pts)
+            pygame.draw.polygon(tile, COLOR_GRASS, [(int(px) - r.x, int(py) - r.y) for px, py in inner])
+            pygame.draw.polygon(tile, (235,235,235), pts, 1)
+
+        return tile
+
+    @staticmethod
+    def _poly_bbox(poly) -> pygame.Rect:
+        xs = [int(px) for px, _ in poly]; ys = [int(py) for _, py in poly]
+        return pygame.Rect(min(xs) - 1, min(ys) - 1, max(xs) - min(xs) + 3, max(ys) - min(ys) + 3)
+
+    def get(self, i: int, j: int, convert: bool = True) -> pygame.Surface:
+        """Tuile (i, j), générée si besoin. convert=False : pas de conversion au format écran
+        (utilisable hors du thread principal, la conversion se fera au premier blit)."""
+        key = (i, j)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = self._render(i, j)
+            self._tiles[key] = tile
+            self._raw.add(key)
+            self.bytes += tile.get_width() * tile.get_height() * tile.get_bytesize()
+        else:
+            self._tiles.move_to_end(key)
+        if convert and key in self._raw and pygame.display.get_surface() is not None:
+            self.bytes -= tile.get_width() * tile.get_height() * tile.get_bytesize()
+            tile = self._tiles[key] = tile.convert()  # blit plus rapide au format écran
+            self.bytes += tile.get_width() * tile.get_height() * tile.get_bytesize()
+            self._raw.discard(key)
+        return tile
+
+    def _drop(self, key):
+        self._raw.discard(key)
+        tile = self._tiles.pop(key, None)
+        if tile is not None:
+            self.bytes -= tile.get_width() * tile.get_height() * tile.get_bytesize()
+
+    def _evict(self, keep):
+        for key in list(self._tiles):
+            if self.bytes <= self.budget:
+                break
+            if key not in keep:
+                self._drop(key)
+
+    # ---------- API caméra ----------
+    def prefetch(self, view: pygame.Rect, limit: int | None = PREFETCH_PER_FRAME,
+                 margin: int = PREFETCH_MARGIN, convert: bool = True):
+        """Génère les tuiles manquantes autour de la vue (au plus `limit` par appel)."""
+        near = self._keys_in_rect(view.inflate(2 * margin, 2 * margin))
+        missing = [k for k in near if k not in self._tiles]
+        # les plus proches du centre de la vue d'abord
+        cx, cy = view.center
+        missing.sort(key=lambda k: math.hypot(self._tile_rect(*k).centerx - cx, self._tile_rect(*k).centery - cy))
+        for key in missing[:limit]:
+            self.get(*key, convert=convert)
+        self._evict(keep=set(near))
+
+    def draw(self, surface: pygame.Surface, cam: pygame.Vector2):
+        ox, oy = int(cam.x), int(cam.y)
+        view = pygame.Rect(ox, oy, surface.get_width(), surface.get_height())
+        keys = self._keys_in_rect(view)
+        for i, j in keys:
+            surface.blit(self.get(i, j), (i * self.chunk - ox, j * self.chunk - oy))
+        self._evict(keep=set(keys))
@@ -1,70 +1,51 @@
 import json, math, random
 from pathlib import Path
+import numpy as np
 import pygame
 
 from .scene import Scene
 from .entities import King, Castle, Port
 from .castle_view import CastleView
 from .battle_view import BattleView
+from . import terrain, terrain_cache, world_chunks, coastline, spatial, text
+from . import pathfinding, distance_field
+from .pathfinding import NavGrid
+from .distance_field import CoastField
+from .spatial import SpatialGrid
+from .profiler import profiled
+from .save import SAVES
 from settings import (
     WIDTH, HEIGHT, WORLD_W, WORLD_H,
-    COLOR_UI,
-    COLOR_WATER_DEEP, COLOR_WATER_SHALLOW, COLOR_SAND, COLOR_GRASS, COLOR_HILL, COLOR_MOUNTAIN
+    COLOR_UI
 )
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
-FONT_CACHE = {}
 SEED = 1337
+BG_SCALE = 4                # sous-échantillonnage du fond (1 = pleine résolution)
+
+# --- grilles à la taille du monde : pas agrandi au-delà d'un budget de cellules (mémoire bornée) ---
+TERRAIN_BUDGET_CELLS = 8_000_000  # collision + terre forcée (~3 o/cellule)
+NAV_BUDGET_CELLS = 200_000        # grille A* (voisins en listes Python : ~0,5 ko/cellule)
+COAST_BUDGET_CELLS = 1_000_000    # champ de distance à la côte (~17 o/cellule), index de côte
+
+def grid_cell(base: int, budget: int, world_w: int = WORLD_W, world_h: int = WORLD_H) -> int:
+    """Pas (px) d'une grille monde : `base`, ou plus grossier si la grille dépasse `budget` cellules."""
+    return max(base, math.ceil(math.sqrt(world_w * world_h / budget)))
+
+TERRAIN_CELL = grid_cell(1, TERRAIN_BUDGET_CELLS)  # pas (px) de la grille de collision is_water/is_land
+NAV_CELL = grid_cell(pathfinding.NAV_CELL, NAV_BUDGET_CELLS)
+COAST_CELL = grid_cell(distance_field.COAST_CELL, COAST_BUDGET_CELLS)
+COAST_STEP = grid_cell(coastline.COAST_STEP, COAST_BUDGET_CELLS)
+TERRAIN_WORKERS = 0         # processus pour la génération du terrain (0 = un par cœur, 1 = série)
 
 # --- paramètres de génération initiale uniquement (premier run) ---
 MAINLAND_CASTLES = 6        # nb de châteaux sur le continent au premier run
 CASTLE_MIN_SPACING = 140    # espacement mini (premier run)
 MIN_PORT_DISTANCE = 120     # éviter de coller aux ports (premier run)
 
+ENTITY_MARGIN = 128         # px hors écran encore dessinés (fanions, noms des châteaux)
 
-def get_font(size: int) -> pygame.font.Font:
-    key = f"default-{size}"
-    if key not in FONT_CACHE:
-        FONT_CACHE[key] = pygame.font.Font(None, size)
-    return FONT_CACHE[key]
-
-# ----- bruit (value noise + fbm) -----
-def _hash2(ix, iy, seed):
-    n = (ix * 374761393) ^ (iy * 668265263) ^ (seed * 1442695041)
-    n = (n ^ (n >> 13)) * 1274126177
-    n = n ^ (n >> 16)
-    return (n & 0xFFFFFFFF) / 0xFFFFFFFF
-
-def _smoothstep(t): return t * t * (3 - 2 * t)
-
-def _value_noise(x, y, freq, seed):
-    x *= freq; y *= freq
-    ix, iy = int(x), int(y)
-    fx, fy = x - ix, y - iy
-    v00 = _hash2(ix,   iy,   seed)
-    v10 = _hash2(ix+1, iy,   seed)
-    v01 = _hash2(ix,   iy+1, seed)
-    v11 = _hash2(ix+1, iy+1, seed)
-    ux, uy = _smoothstep(fx), _smoothstep(fy)
-    a = v00 + (v10 - v00) * ux
-    b = v01 + (v11 - v01) * ux
-    return a + (b - a) * uy
-
-def _fbm(x, y, seed):
-    return (
-        0.55 * _value_noise(x, y, 1.2, seed) +
-        0.30 * _value_noise(x, y, 3.1, seed+11) +
-        0.15 * _value_noise(x, y, 6.4, seed+29)
-    )
-
-def _classify(v):
-    if v < 0.35: return COLOR_WATER_DEEP
-    if v < 0.40: return COLOR_WATER_SHALLOW
-    if v < 0.45: return COLOR_SAND
-    if v < 0.75: return COLOR_GRASS
-    if v < 0.90: return COLOR_HILL
-    return COLOR_MOUNTAIN
 
 def _make_vignette(size):
     w, h = size
@@ -89,38 +70,66 @@ def _draw_dotted_line(surf, a, b, dash=12, gap=8, color=(245,245,245)):
         pygame.draw.line(surf, color, (int(pos.x), int(pos.y)), (int(end.x), int(end.y)), 2)
         pos = end + dir * gap
 
-# ----- overrides de terre via mask (îlots organiques) -----
+# ----- overrides de terre (îlots organiques), masque 1 bit/pixel -----
 class LandOverrides:
-    def __init__(self, w, h):
-        self.surface = pygame.Surface((w, h), pygame.SRCALPHA)  # alpha>0 => terre forcée
-        self.mask: pygame.Mask | None = None
-    def _commit(self):
-        self.mask = pygame.mask.from_surface(self.surface)
+    """
+    Terre forcée stockée bit à bit : `bits[j, i >> 3]`, bit de poids fort = i le plus à gauche
+    (ordre np.packbits). Un bit couvre une cellule de `cell` px (même pas que la grille de collision).
+    Un polygone n'est rasterisé et fusionné que sur sa boîte englobante.
+    """
+    def __init__(self, w, h, cell=1):
+        self.w, self.h = w, h
+        self.cell = cell
+        self.gw, self.gh = -(-w // cell), -(-h // cell)
+        self.bits = np.zeros((self.gh, (self.gw + 7) // 8), dtype=np.uint8)
+    def load_land(self, bits):
+        """Restaure un masque déjà empaqueté (cache disque)."""
+        self.bits = np.array(bits, dtype=np.uint8)
     def add_polygon(self, pts):
-        pygame.draw.polygon(self.surface, (255,255,255,255), [(int(px),int(py)) for px,py in pts])
-        self._commit()
+        """Rasterise le polygone dans sa seule boîte englobante, fusionnée au masque."""
+        c = self.cell
+        pts = [(int(px / c), int(py / c)) for px,py in pts]
+        if not pts: return
+        xs = [px for px,_ in pts]; ys = [py for _,py in pts]
+        box = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+        box = box.clip(pygame.Rect(0, 0, self.gw, self.gh))
+        if box.width == 0 or box.height == 0: return
+        # aligner la boîte sur des octets pour fusionner sans décalage de bits
+        bx0, bx1 = box.left // 8, (box.right + 7) // 8
+        local = pygame.Surface(((bx1 - bx0) * 8, box.height), 0, 8)
+        ox, oy = bx0 * 8, box.top
+        pygame.draw.polygon(local, 1, [(px - ox, py - oy) for px,py in pts])
+        # la partie de l'octet au-delà du bord droit du monde reste à 0
+        filled = pygame.surfarray.array2d(local).T[:, :max(0, self.gw - ox)] != 0
+        packed = np.packbits(filled, axis=1)
+        self.bits[box.top:box.bottom, bx0:bx0 + packed.shape[1]] |= packed
+    def add_polygons(self, polys):
+        """Un tampon par boîte de polygone : deux îlots éloignés ne coûtent pas la surface qui les sépare."""
+        for pts in polys:
+            self.add_polygon(pts)
     def is_land_here(self, x, y):
-        if self.mask is None: return False
-        xi, yi = int(x), int(y)
-        if 0 <= xi < self.mask.get_size()[0] and 0 <= yi < self.mask.get_size()[1]:
-            return self.mask.get_at((xi, yi)) == 1
+        xi, yi = int(x) // self.cell, int(y) // self.cell
+        if 0 <= xi < self.gw and 0 <= yi < self.gh:
+            return bool((self.bits[yi, xi >> 3] >> (7 - (xi & 7))) & 1)
         return False
-
-def _island_mask(nx, ny):
-    # masque radial: centre plus haut, bords plus bas -> île centrale, mer autour
-    dx = nx - 0.5
-    dy = ny - 0.5
-    r = math.hypot(dx, dy) / 0.7071
-    falloff = 1.0 - (r**1.6)
-    return max(0.0, min(1.0, falloff))
-
+    def is_land_many(self, xs, ys):
+        xi = np.asarray(xs).astype(np.int64) // self.cell; yi = np.asarray(ys).astype(np.int64) // self.cell
+        inside = (xi >= 0) & (xi < self.gw) & (yi >= 0) & (yi < self.gh)
+        out = np.zeros(xi.shape, dtype=bool)
+        xin, yin = xi[inside], yi[inside]
+        out[inside] = (self.bits[yin, xin >> 3] >> (7 - (xin & 7))) & 1
+        return out
 
 class WorldMap(Scene):
+    idle_fps = 10.0  # pulsation du roi à l'arrêt
     def __init__(self, manager):
         super().__init__(manager)
         self.king: King | None = None
         self.castles: list[Castle] = []
         self.ports: list[Port] = []
+        # index spatiaux (hit-test, placement) ; à tenir à jour avec les listes
+        self.castle_index = SpatialGrid()
+        self.port_index = SpatialGrid()
         self.selected: Castle | None = None
         self.hovered_castle: Castle | None = None
         self.hovered_port: Port | None = None
@@ -129,13 +138,16 @@ class WorldMap(Scene):
         self._event_interval = 4.0
         self._event_chance = 0.12
 
-        self._bg: pygame.Surface | None = None
+        self._chunks: world_chunks.WorldChunks | None = None  # fond de carte en tuiles
         self._vignette: pygame.Surface | None = None
 
         self.cam = pygame.Vector2(0, 0)
         self._last_target: pygame.Vector2 | None = None
 
-        self.land_over = LandOverrides(WORLD_W, WORLD_H)
+        self.land_over = LandOverrides(WORLD_W, WORLD_H, TERRAIN_CELL)
+        self.terrain: terrain.TerrainField | None = None  # grilles hauteur/classe (on_enter)
+        self.nav: NavGrid | None = None                    # grille A* terre/bateau (on_enter)
+        self.coast: CoastField | None = None               # terre/eau la plus proche (on_enter)
 
         # Flash visuel après embarquement/débarquement
         self._mode_flash_timer = 0.0
@@ -147,13 +159,14 @@ class WorldMap(Scene):
         # Blobs d’îlots (cx, cy, r) pour placer 1 château/îlot au premier run
         self._islet_blobs: list[tuple[int,int,int]] = []
 
-        # Snapshot pour savoir si l’owner a changé -> autosave propre
-        self._last_saved_owners: dict[str,str] = {}
+        # Snapshot (owners, inventaire du roi) pour savoir si l'état a changé -> autosave propre
+        self._last_saved: tuple = ()
 
         # Pool de noms (déterministe), index courant
         self._name_pool: list[str] = []
         self._name_idx: int = 0
 
+        self._generated = False  # iter_generation() terminé
         self._load_world()
 
     # =============== NOMS DE CHÂTEAUX (déterministe, style homogène) ===============
@@ -212,46 +225,84 @@ class WorldMap(Scene):
         if isinstance(child, CastleView):
             self.selected = None
             self._castle_cooldown = 0.45  # ~1/2 seconde pour éviter re-pop immédiat
-            # si des owners ont changé, on sauve l’état (JSON comme sauvegarde)
-            if self._owners_changed_since_last_save():
+            # si des owners ou l'inventaire ont changé, on sauve l’état (JSON comme sauvegarde)
+            if self._changed_since_last_save():
                 self._save_layout()
 
     # ---------- terrain helpers ----------
-    def _height(self, x, y):
-        nx, ny = x / WORLD_W, y / WORLD_H
-        v = _fbm(nx, ny, SEED)
-        v *= 0.75 + 0.25 * _island_mask(nx, ny)  # île au centre
-        light = 0.08 * (1 - (nx + (1 - ny)) / 2)
-        return max(0.0, min(1.0, v + light))
+    def _build_terrain_field(self):
+        if self.terrain is None:
+            self.terrain = terrain.TerrainField(WORLD_W, WORLD_H, SEED, cell=TERRAIN_CELL, workers=TERRAIN_WORKERS)
 
     def is_water(self, x, y):
         if self.land_over.is_land_here(x, y):
             return False
-        v = self._height(x, y)
-        return v < 0.40  # eau (deep+shallow)
+        return self.terrain.is_water(x, y)  # eau (deep+shallow)
+
+    def is_water_many(self, xs, ys):
+        """Version par lots : tableaux de points -> tableau de booléens."""
+        return self.terrain.is_water_many(xs, ys) & ~self.land_over.is_land_many(xs, ys)
+
+    def is_land_many(self, xs, ys):
+        return ~self.is_water_many(xs, ys)
 
     def is_land(self, x, y):
         return not self.is_water(x, y)
 
     def on_enter(self):
-        self._render_background()
-        self._generate_islets_and_ports()
+        # génération synchrone si aucun LoadingView ne l'a déjà faite
+        for _ in self.iter_generation():
+            pass
+
+    def iter_generation(self):
+        """
+        Génère le monde étape par étape. Chaque yield (libellé, fraction) précède l'étape
+        correspondante : un consommateur peut afficher la progression ou s'arrêter entre deux étapes.
+        """
+        if self._generated:
+            return
+        yield "Chargement du terrain", 0.0
+        if not self._load_terrain_cache():
+            yield "Relief", 0.10
+            self._build_terrain_field()
+            yield "Fond de carte", 0.40
+            self._render_background()
+            yield "Îlots et ports", 0.60
+            self._generate_islets_and_ports()
+            self._store_terrain_cache()
+        self._vignette = _make_vignette((WIDTH, HEIGHT))
+
+        yield "Navigation", 0.75
+        self.nav = NavGrid.from_world(self, WORLD_W, WORLD_H, cell=NAV_CELL)
+        self.coast = CoastField.from_world(self, WORLD_W, WORLD_H, cell=COAST_CELL)
 
+        yield "Châteaux", 0.80
         # Si aucun château n’a été chargé du JSON (premier run) -> génération initiale UNIQUEMENT
-        if len(self.castles) == 0:
+        first_run = len(self.castles) == 0
+        if first_run:
             self._generate_initial_castles()
-            self._reposition_water_castles()
+
+        yield "Recalage des châteaux", 0.85
+        # positions respectées telles que dans le JSON, recentrer seulement si eau
+        self._reposition_water_castles()
+        if first_run:
             self._save_layout()  # fige la seed en positions & noms initiaux
-        else:
-            # positions respectées telles que dans le JSON, recentrer seulement si eau
-            self._reposition_water_castles()
 
+        yield "Placement du roi", 0.95
         # Assurer un spawn du roi sur la terre
         if self.is_water(self.king.pos.x, self.king.pos.y):
             nx, ny = self._nearest_land(self.king.pos.x, self.king.pos.y, max_r=600)
             self.king.pos.update(nx, ny)
+            self.king.snap()
             self.king.mode = "land"
 
+        yield "Tuiles visibles", 0.97
+        # tuiles de la première vue prêtes avant l'affichage (converties au premier blit)
+        self._center_camera_on_king()
+        if not self.mgr.headless:
+            self._chunks.prefetch(self._view_rect(), limit=None, margin=0, convert=False)
+        self._generated = True
+
     def _load_world(self):
         world_path = DATA_DIR / "world_map.json"
         data = {
@@ -263,34 +314,63 @@ class WorldMap(Scene):
 
         k = data["king"]
         self.king = King(k["x"], k["y"], speed=k.get("speed", 200))
-        self.castles = [Castle(c["name"], c["x"], c["y"], c.get("owner","enemy"))
-                        for c in data.get("castles", [])]
-
-        # snapshot des owners pour detecter un changement plus tard
-        self._last_saved_owners = {c.name: c.owner for c in self.castles}
-
+        self.king.resources.update(k.get("resources", {}))
+        self.king.equipment = dict(k.get("equipment", {}))
+        self.king.army = dict(k.get("army", {}))
+        self.mgr.game_state.king = self.king  # boutique / caserne : même roi que sur la carte
+        self.castles = []
+        self.castle_index = SpatialGrid()
+        for c in data.get("castles", []):
+            self._add_castle(Castle(c["name"], c["x"], c["y"], c.get("owner","enemy")))
+
+        # snapshot owners + inventaire pour detecter un changement plus tard
+        self._last_saved = self._save_state()
+
+    @profiled()
     def _render_background(self):
-        scale = 4
-        low_w, low_h = max(1, WORLD_W // scale), max(1, WORLD_H // scale)
-        low = pygame.Surface((low_w, low_h))
-        for y in range(low_h):
-            ny = y / low_h
-            for x in range(low_w):
-                nx = x / low_w
-                v = _fbm(nx, ny, SEED)
-                v *= 0.75 + 0.25 * _island_mask(nx, ny)  # île centrale
-                light = 0.08 * (1 - (nx + (1 - ny)) / 2)
-                v = max(0.0, min(1.0, v + light))
-                low.set_at((x, y), _classify(v))
-        bg = pygame.transform.smoothscale(low, (WORLD_W, WORLD_H))
-        # bordure douce
-        overlay = pygame.Surface((WORLD_W, WORLD_H), pygame.SRCALPHA)
-        for c in range(6):
-            alpha = 18 - c*3
-            pygame.draw.rect(overlay, (0,0,0,alpha), overlay.get_rect(), width=1+c)
-        bg.blit(overlay, (0,0))
-        self._bg = bg
-        self._vignette = _make_vignette((WIDTH, HEIGHT))
+        # fond découpé en tuiles, rasterisées à la demande autour de la caméra (world_chunks)
+        self._chunks = world_chunks.WorldChunks(WORLD_W, WORLD_H, SEED, BG_SCALE)
+
+    # ---------- cache disque du terrain (fond + îlots + ports) ----------
+    def _terrain_cache_key(self) -> str:
+        params = {"seed": SEED, "world": [WORLD_W, WORLD_H], "bg_scale": BG_SCALE,
+                  "cell": TERRAIN_CELL, "coast_step": COAST_STEP, "palette": terrain.PALETTE.tolist()}
+        return terrain_cache.make_key(
+            params, terrain, world_chunks, coastline, spatial, LandOverrides, WorldMap._render_background,
+            WorldMap._make_blob_islet, WorldMap._ring_is_mostly_water, WorldMap._generate_islets_and_ports)
+
+    def _load_terrain_cache(self) -> bool:
+        entry = terrain_cache.TerrainCache(DATA_DIR / "terrain_cache").load(self._terrain_cache_key())
+        if entry is None:
+            return False
+        self.terrain = terrain.TerrainField.from_grids(
+            WORLD_W, WORLD_H, SEED, TERRAIN_CELL, entry["height"], entry["classes"])
+        self.land_over.load_land(entry["land_bits"])
+        layout = entry["layout"]
+        self._render_background()
+        for poly, inner in layout["islet_polys"]:
+            self._chunks.add_islet([tuple(p) for p in poly], [tuple(p) for p in inner])
+        self._islet_blobs = [tuple(b) for b in layout["islets"]]
+        self._clear_ports()
+        for p in layout["ports"]:
+            self._add_port(Port(p["name"], p["x"], p["y"]))
+        return True
+
+    def _store_terrain_cache(self):
+        arrays = {
+            "height": self.terrain.height,
+            "classes": self.terrain.classes,
+            "land_bits": self.land_over.bits,
+        }
+        layout = {
+            "islets": [list(b) for b in self._islet_blobs],
+            "islet_polys": [[poly, inner] for poly, inner in self._chunks.islets],
+            "ports": [{"name": p.name, "x": p.pos.x, "y": p.pos.y} for p in self.ports],
+        }
+        try:
+            terrain_cache.TerrainCache(DATA_DIR / "terrain_cache").store(self._terrain_cache_key(), arrays, layout)
+        except OSError:
+            pass  # cache optionnel : on régénérera au prochain lancement
 
     # ---------- îlots organiques “décollés” ----------
     def _make_blob_islet(self, cx, cy, r_base, spikes=14):
@@ -320,15 +400,38 @@ class WorldMap(Scene):
                     water += 1
         return total > 0 and (water / total) >= ratio
 
+    # ---------- entités + index spatiaux ----------
+    def _add_castle(self, castle: Castle):
+        self.castles.append(castle)
+        self.castle_index.insert(castle, castle.pos.x, castle.pos.y, castle.radius)
+
+    def _add_port(self, port: Port):
+        self.ports.append(port)
+        self.port_index.insert(port, port.pos.x, port.pos.y, port.radius)
+
+    def _clear_ports(self):
+        self.ports = []
+        self.port_index = SpatialGrid()
+
+    def castle_at(self, x, y) -> Castle | None:
+        hits = self.castle_index.query_point(x, y)
+        return hits[0] if hits else None
+
+    def port_at(self, x, y) -> Port | None:
+        hits = self.port_index.query_point(x, y)
+        return hits[0] if hits else None
+
+    @profiled()
     def _generate_islets_and_ports(self):
         random.seed(SEED + 2025)
-        self.ports = []
+        self._clear_ports()
 
         # -------- îlots (loin des bords & du continent) --------
         margin = 180
         wanted_islets = 6
         min_islet_spacing = 150
         blobs = []
+        blob_index = SpatialGrid(cell=256)
         attempts = 0
 
         while len(blobs) < wanted_islets and attempts < 800:
@@ -338,64 +441,65 @@ class WorldMap(Scene):
             if not self.is_water(x, y):
                 continue
             r = random.randint(70, 120)
-            if any(pygame.Vector2(x-bx, y-by).length() < (br + min_islet_spacing) for bx,by,br in blobs):
+            near = blob_index.query_radius(x, y, 120 + min_islet_spacing, strict=True)  # 120 = r max
+            if any((x-bx)**2 + (y-by)**2 < (br + min_islet_spacing)**2 for bx,by,br in near):
                 continue
             if not self._ring_is_mostly_water(x, y, r, gap=40, step_deg=8, ratio=0.9):
                 continue
             blobs.append((x, y, r))
+            blob_index.insert(blobs[-1], x, y)
 
         # mémoriser pour 1 château/îlot (premier run uniquement)
         self._islet_blobs = blobs[:]
 
-        # dessiner + override en terre
+        # dessiner + override en terre (un seul commit du masque pour tous les îlots)
+        polys = []
         for (cx, cy, r) in blobs:
             poly = self._make_blob_islet(cx, cy, r, spikes=random.randint(12,18))
-            pygame.draw.polygon(self._bg, COLOR_SAND, [(int(px),int(py)) for px,py in poly])
             inner = [(cx + (px-cx)*0.82, cy + (py-cy)*0.82) for (px,py) in poly]
-            pygame.draw.polygon(self._bg, COLOR_GRASS, [(int(px),int(py)) for px,py in inner])
-            pygame.draw.polygon(self._bg, (235,235,235), [(int(px),int(py)) for px,py in poly], 1)
-            self.land_over.add_polygon(poly)
+            self._chunks.add_islet(poly, inner)
+            polys.append(poly)
+        self.land_over.add_polygons(polys)
 
         # -------- Ports --------
-        def _find_coast():
-            for _ in range(3500):
-                x = random.randint(24, WORLD_W-24)
-                y = random.randint(24, WORLD_H-24)
-                if self.is_land(x, y) and any(self.is_water(x+dx, y+dy) for dx,dy in ((18,0),(-18,0),(0,18),(0,-18))):
-                    return x, y
-            return None
+        # points de côte extraits une fois (îlots compris) : on tire parmi les candidats valides
+        coast = coastline.CoastIndex.from_world(self, WORLD_W, WORLD_H, step=COAST_STEP)
 
         # Ports continent (max 3), espacés
         mainland_ports_target = 3
         min_port_spacing = 160
+        candidates = coast.within_rect(margin, margin, WORLD_W - margin, WORLD_H - margin)
         tries = 0
         while len([p for p in self.ports if not p.name.startswith("Îlot-")]) < mainland_ports_target and tries < 800:
             tries += 1
-            p = _find_coast()
-            if not p: break
-            if p[0] < margin or p[0] > WORLD_W-margin or p[1] < margin or p[1] > WORLD_H-margin:
-                continue
-            if any(pygame.Vector2(p[0]-pp.pos.x, p[1]-pp.pos.y).length() < min_port_spacing for pp in self.ports):
+            if len(candidates) == 0: break
+            x, y = coast.points[candidates[random.randrange(len(candidates))]].tolist()
+            if self.port_index.any_within(x, y, min_port_spacing):
                 continue
-            self.ports.append(Port(f"Port-{len(self.ports)+1}", *p))
+            self._add_port(Port(f"Port-{len(self.ports)+1}", x, y))
 
         # 1 port par îlot (sur la côte de l’îlot)
         for i, (cx,cy,r) in enumerate(blobs, start=1):
+            near = coast.within_radius(cx, cy, r * 1.7)
+            pts = coast.points[near]
+            near = near[self.land_over.is_land_many(pts[:, 0], pts[:, 1])]  # terre forcée = cet îlot
+            pts = coast.points[near]
+            # balayage angulaire depuis 0° autour du centre, comme l'ancienne recherche
+            ang = np.degrees(np.arctan2(pts[:, 1] - cy, pts[:, 0] - cx)) % 360
             placed = False
-            for ang in range(0, 360, 10):
-                px = int(cx + math.cos(math.radians(ang)) * int(r*0.9))
-                py = int(cy + math.sin(math.radians(ang)) * int(r*0.9))
-                if self.is_land(px, py) and any(self.is_water(px+dx, py+dy) for dx,dy in ((16,0),(-16,0),(0,16),(0,-16))):
-                    if all(pygame.Vector2(px-pp.pos.x, py-pp.pos.y).length() >= 140 for pp in self.ports):
-                        self.ports.append(Port(f"Îlot-Port-{i}", px, py))
-                        placed = True
-                        break
+            for k in np.argsort(ang, kind="stable"):
+                px, py = pts[k].tolist()
+                if not self.port_index.any_within(px, py, 140):
+                    self._add_port(Port(f"Îlot-Port-{i}", px, py))
+                    placed = True
+                    break
             if not placed:
                 # fallback unique (mais on garde UN seul port)
                 px = int(cx + r*0.8); py = int(cy)
-                self.ports.append(Port(f"Îlot-Port-{i}", px, py))
+                self._add_port(Port(f"Îlot-Port-{i}", px, py))
 
     # ---------- génération INITIALE UNIQUEMENT ----------
+    @profiled()
     def _generate_initial_castles(self):
         rng = random.Random(SEED + 500)
 
@@ -405,6 +509,7 @@ class WorldMap(Scene):
 
         # A) Continent : MAINLAND_CASTLES points sur la terre, espacés, loin des ports
         created: list[Castle] = []
+        created_index = SpatialGrid()
         tries = 0
         while len(created) < MAINLAND_CASTLES and tries < MAINLAND_CASTLES * 2000:
             tries += 1
@@ -412,29 +517,35 @@ class WorldMap(Scene):
             y = rng.randint(80, WORLD_H - 80)
             if not self.is_land(x, y):
                 continue
-            if any(pygame.Vector2(x - p.pos.x, y - p.pos.y).length() < MIN_PORT_DISTANCE for p in self.ports):
+            if self.port_index.any_within(x, y, MIN_PORT_DISTANCE):
                 continue
-            if any(pygame.Vector2(x - c.pos.x, y - c.pos.y).length() < CASTLE_MIN_SPACING for c in created):
+            if created_index.any_within(x, y, CASTLE_MIN_SPACING):
                 continue
             created.append(Castle(self._next_castle_name(), x, y, owner="enemy"))
+            created_index.insert(created[-1], x, y)
 
         # B) 1 château par îlot (centre des blobs)
         for _i, (cx, cy, _r) in enumerate(self._islet_blobs, start=1):
             created.append(Castle(self._next_castle_name(), cx, cy, owner="enemy"))
 
         # Fusionner (ici on part de zéro)
-        self.castles.extend(created)
+        for c in created:
+            self._add_castle(c)
 
     def _nearest_land(self, x, y, max_r=600):
-        p = pygame.Vector2(x, y)
-        for r in range(2, max_r, 2):
-            for a in range(0, 360, 8):
-                off = pygame.Vector2(1,0).rotate(a) * r
-                test = p + off
-                if 0 <= test.x < WORLD_W and 0 <= test.y < WORLD_H and self.is_land(test.x, test.y):
-                    return int(test.x), int(test.y)
-        return int(x), int(y)
-
+        # lecture O(1) du champ de distance (au lieu de sonder des anneaux avec is_water)
+        p = self.coast.nearest_land(x, y)
+        if p is None or math.hypot(p[0] - x, p[1] - y) >= max_r:
+            return int(x), int(y)
+        return p
+
+    def _nearest_water(self, x, y, max_r=600):
+        p = self.coast.nearest_water(x, y)
+        if p is None or math.hypot(p[0] - x, p[1] - y) >= max_r:
+            return int(x), int(y)
+        return p
+
+    @profiled()
     def _reposition_water_castles(self):
         # sécurité: si un château est en mer (modif externe), on le recolle à la terre la plus proche
         for c in self.castles:
@@ -445,87 +556,94 @@ class WorldMap(Scene):
                     near = min(self.ports, key=lambda p: pygame.Vector2(p.pos - c.pos).length())
                     nx, ny = int(near.pos.x + 24), int(near.pos.y + 24)
                 c.pos.update(nx, ny)
+                self.castle_index.update(c)
 
     # ---- Persistance / Sauvegarde d’état (JSON comme "save") ----
-    def _owners_changed_since_last_save(self) -> bool:
-        cur = {c.name: c.owner for c in self.castles}
-        return cur != self._last_saved_owners
-
-    def _save_layout(self):
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        world_path = DATA_DIR / "world_map.json"
-        data = {
-            "king": {"x": int(self.king.pos.x), "y": int(self.king.pos.y), "speed": self.king.speed},
+    def _save_state(self) -> tuple:
+        k = self.king
+        return ({c.name: c.owner for c in self.castles}, dict(k.resources), dict(k.equipment), dict(k.army))
+
+    def _changed_since_last_save(self) -> bool:
+        return self._save_state() != self._last_saved
+
+    def layout(self) -> dict:
+        """État sauvegardé (contenu de world_map.json)."""
+        return {
+            "king": {"x": int(self.king.pos.x), "y": int(self.king.pos.y), "speed": self.king.speed,
+                     "resources": dict(self.king.resources), "equipment": dict(self.king.equipment),
+                     "army": dict(self.king.army)},
             "castles": [{"name": c.name, "x": int(c.pos.x), "y": int(c.pos.y), "owner": c.owner}
                         for c in self.castles]
         }
-        world_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        # refresh snapshot owners
-        self._last_saved_owners = {c.name: c.owner for c in self.castles}
+
+    def _save_layout(self):
+        # instantané ici, sérialisation + écriture atomique sur le thread de sauvegarde ;
+        # marqué sauvegardé une fois le fichier remplacé (échec : nouvel essai au prochain changement)
+        state = self._save_state()
+        SAVES.request(DATA_DIR / "world_map.json", self.layout(),
+                      on_done=lambda: setattr(self, "_last_saved", state))
 
     # ------------- helpers caméra -------------
     def _screen_to_world(self, sx, sy):
         return (sx + self.cam.x, sy + self.cam.y)
 
+    @staticmethod
+    def _camera_at(pos) -> pygame.Vector2:
+        return pygame.Vector2(max(0, min(pos.x - WIDTH / 2, WORLD_W - WIDTH)),
+                              max(0, min(pos.y - HEIGHT / 2, WORLD_H - HEIGHT)))
+
     def _center_camera_on_king(self):
-        self.cam.x = self.king.pos.x - WIDTH / 2
-        self.cam.y = self.king.pos.y - HEIGHT / 2
-        self.cam.x = max(0, min(self.cam.x, WORLD_W - WIDTH))
-        self.cam.y = max(0, min(self.cam.y, WORLD_H - HEIGHT))
+        self.cam.update(self._camera_at(self.king.pos))
+
+    def _view_rect(self) -> pygame.Rect:
+        return pygame.Rect(int(self.cam.x), int(self.cam.y), WIDTH, HEIGHT)
+
+    def _route_king(self, x, y):
+        # A* selon le mode ; à défaut de route, ligne droite (bloquée par le terrain comme avant)
+        path = self.nav.find_path(self.king.pos, (x, y), self.king.mode) if self.nav else None
+        if path:
+            self.king.follow(path)
+        else:
+            self.king.move_to(x, y)
+        self._last_target = pygame.Vector2(x, y)
 
     # ------------- events -------------
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
             mx, my = event.pos
             wx, wy = self._screen_to_world(mx, my)
-            self.hovered_castle = None
-            self.hovered_port = None
-            for c in self.castles:
-                if c.is_point_inside(wx, wy):
-                    self.hovered_castle = c
-                    break
-            if not self.hovered_castle:
-                for p in self.ports:
-                    if p.is_point_inside(wx, wy):
-                        self.hovered_port = p
-                        break
+            self.hovered_castle = self.castle_at(wx, wy)
+            self.hovered_port = None if self.hovered_castle else self.port_at(wx, wy)
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = pygame.mouse.get_pos()
+            mx, my = event.pos
             wx, wy = self._screen_to_world(mx, my)
-            clicked_castle = None
-            for c in self.castles:
-                if c.is_point_inside(wx, wy):
-                    clicked_castle = c
-                    break
-            clicked_port = None
-            if not clicked_castle:
-                for p in self.ports:
-                    if p.is_point_inside(wx, wy):
-                        clicked_port = p
-                        break
+            clicked_castle = self.castle_at(wx, wy)
+            clicked_port = None if clicked_castle else self.port_at(wx, wy)
 
             if clicked_castle:
                 self.selected = clicked_castle
-                self.king.move_to(clicked_castle.pos.x, clicked_castle.pos.y)
-                self._last_target = pygame.Vector2(clicked_castle.pos)
+                self._route_king(clicked_castle.pos.x, clicked_castle.pos.y)
             elif clicked_port:
                 self.selected = None
-                self.king.move_to(clicked_port.pos.x, clicked_port.pos.y)
-                self._last_target = pygame.Vector2(clicked_port.pos)
+                self._route_king(clicked_port.pos.x, clicked_port.pos.y)
             else:
                 # mouvement manuel -> on annule la sélection pour éviter repop auto
                 self.selected = None
                 if self.king.mode == "land" and self.is_land(wx, wy):
-                    self.king.move_to(wx, wy)
-                    self._last_target = pygame.Vector2(wx, wy)
+                    self._route_king(wx, wy)
                 elif self.king.mode == "boat" and self.is_water(wx, wy):
-                    self.king.move_to(wx, wy)
-                    self._last_target = pygame.Vector2(wx, wy)
+                    self._route_king(wx, wy)
 
         elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.mgr.quit = True
 
+    @property
+    def animating(self) -> bool:
+        # au repos, seul le halo du roi pulse : cadence réduite (idle_fps)
+        return (self.king.moving or self._mode_flash_timer > 0 or self._castle_cooldown > 0
+                or self.selected is not None)
+
     def update(self, dt: float):
         # cooldown château
         if self._castle_cooldown > 0:
@@ -536,9 +654,9 @@ class WorldMap(Scene):
 
         # blocage terrain interdit
         if self.king.mode == "land" and self.is_water(self.king.pos.x, self.king.pos.y):
-            self.king.pos.update(prev); self.king.target = None
+            self.king.pos.update(prev); self.king.stop()
         elif self.king.mode == "boat" and self.is_land(self.king.pos.x, self.king.pos.y):
-            self.king.pos.update(prev); self.king.target = None
+            self.king.pos.update(prev); self.king.stop()
 
         self._center_camera_on_king()
 
@@ -548,13 +666,10 @@ class WorldMap(Scene):
             self.mgr.push(CastleView(self.mgr, self.selected))
 
         # Embarquement/débarquement auto
-        if not self.king.moving:
-            for p in self.ports:
-                if self.king.is_near(p.pos.x, p.pos.y, radius=20):
-                    self.king.mode = "boat" if self.king.mode == "land" else "land"
-                    self._mode_flash_kind = self.king.mode
-                    self._mode_flash_timer = 1.2
-                    break
+        if not self.king.moving and self.port_index.query_radius(self.king.pos.x, self.king.pos.y, 20):
+            self.king.mode = "boat" if self.king.mode == "land" else "land"
+            self._mode_flash_kind = self.king.mode
+            self._mode_flash_timer = 1.2
 
         # timer du flash d’icône
         if self._mode_flash_timer > 0:
@@ -571,45 +686,51 @@ class WorldMap(Scene):
                     self.mgr.push(BattleView(self.mgr))
 
     def draw(self, surface: pygame.Surface):
-        if self._bg:
-            surface.blit(self._bg, (-int(self.cam.x), -int(self.cam.y)))
+        # rendu interpolé entre les deux derniers pas de simulation (mgr.alpha)
+        kpos = self.king.render_pos(self.mgr.alpha)
+        cam = self.cam + self._camera_at(kpos) - self._camera_at(self.king.pos)
+        if self._chunks:
+            self._chunks.draw(surface, cam)
+            # une fois par frame affichée (pas par pas de simulation) : tuiles voisines préparées à l'avance
+            self._chunks.prefetch(pygame.Rect(int(cam.x), int(cam.y), WIDTH, HEIGHT))
 
         # Trace du chemin
         if self.king.moving and self.king.target is not None:
-            a = self.king.pos - self.cam
-            b = self.king.target - self.cam
-            _draw_dotted_line(surface, a, b, color=(250,250,250))
-        elif self._last_target is not None and self.king.pos.distance_to(self._last_target) > 4:
-            a = self.king.pos - self.cam
-            b = self._last_target - self.cam
+            pts = [kpos, self.king.target, *self.king.path]
+            for a, b in zip(pts, pts[1:]):
+                _draw_dotted_line(surface, a - cam, b - cam, color=(250,250,250))
+        elif self._last_target is not None and kpos.distance_to(self._last_target) > 4:
+            a = kpos - cam
+            b = self._last_target - cam
             _draw_dotted_line(surface, a, b, color=(220,220,220))
 
-        # Châteaux
-        for c in self.castles:
-            c.draw(surface, offset=self.cam)
-            if self.hovered_castle is c:
-                sp = c.pos - self.cam
-                pygame.draw.circle(surface, (255,255,255), (int(sp.x), int(sp.y)), c.radius+6, 2)
-            f = get_font(20)
-            name_shadow = f.render(c.name, True, (20,20,20))
-            sp = c.pos - self.cam
-            surface.blit(name_shadow, (sp.x - name_shadow.get_width()/2 + 1, sp.y + c.radius + 8 + 1))
-            surface.blit(f.render(c.name, True, (245,245,245)),
-                         (sp.x - name_shadow.get_width()/2, sp.y + c.radius + 8))
-
-        # Ports
-        for p in self.ports:
-            p.draw(surface, offset=self.cam)
-            if self.hovered_port is p:
-                sp = p.pos - self.cam
-                pygame.draw.circle(surface, (245,245,245), (int(sp.x), int(sp.y)), p.radius+6, 2)
+        # Entités visibles seulement (index spatial), blittées par lots. Ordre d'avant conservé :
+        # par château sprite, anneau de survol, nom ; puis par port sprite, anneau
+        # (le lot est vidé avant chaque anneau, dessiné hors blits)
+        view = pygame.Rect(int(cam.x), int(cam.y), WIDTH, HEIGHT).inflate(2 * ENTITY_MARGIN, 2 * ENTITY_MARGIN)
+        ox, oy = cam.x, cam.y
+        batch = []
+        for index, hovered, col in ((self.castle_index, self.hovered_castle, (255,255,255)),
+                                    (self.port_index, self.hovered_port, (245,245,245))):
+            for e in index.query_rect(view):
+                img, (ax, ay) = e.sprite()
+                batch.append((img, (int(e.pos.x - ox) - ax, int(e.pos.y - oy) - ay)))
+                if e is hovered:
+                    surface.blits(batch, doreturn=False)
+                    batch = []
+                    pygame.draw.circle(surface, col, (int(e.pos.x - ox), int(e.pos.y - oy)), e.radius+6, 2)
+                if isinstance(e, Castle):
+                    shadow, lab = text.render(e.name, 20, (20,20,20)), text.render(e.name, 20, (245,245,245))
+                    x, y = e.pos.x - ox - lab.get_width() / 2, e.pos.y - oy + e.radius + 8
+                    batch += ((shadow, (x + 1, y + 1)), (lab, (x, y)))
+        surface.blits(batch, doreturn=False)
 
         # Roi
-        self.king.draw(surface, offset=self.cam)
+        self.king.draw(surface, offset=cam, alpha=self.mgr.alpha)
 
         # Flash d’icône “mode”
         if self._mode_flash_kind:
-            sp = self.king.pos - self.cam
+            sp = kpos - cam
             y = sp.y - 32
             if self._mode_flash_kind == "boat":
                 pygame.draw.polygon(surface, (30,30,30), [(sp.x-12,y+2),(sp.x+12,y+2),(sp.x+8,y+12),(sp.x-8,y+12)])
@@ -626,6 +747,5 @@ class WorldMap(Scene):
             surface.blit(self._vignette, (0,0))
 
         # Aide
-        f = get_font(20)
         help_text = f"[Mode: {'Bateau' if self.king.mode=='boat' else 'Terre'}]  Clic: se déplacer  |  Clic PORT: embarquer/débarquer  |  En bateau: clic sur l'eau pour naviguer  |  ESC: quitter"
-        surface.blit(f.render(help_text, True, COLOR_UI), (16, HEIGHT - 28))
+        surface.blit(text.render(help_text, 20, COLOR_UI), (16, HEIGHT - 28))
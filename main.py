@@ -1,31 +1,86 @@
-import sys
+import argparse, sys
 import pygame
-from settings import WIDTH, HEIGHT, FPS
+from settings import WIDTH, HEIGHT, SIM_HZ
 from game.scene import SceneManager
 from game.world_map import WorldMap
+from game.loading_view import LoadingView
+from game.scheduler import FrameScheduler, FixedStep
+from game import replay
+from game.save import SAVES
+
+def _replay(args) -> int:
+    """Rejoue un enregistrement (--replay), avec fenêtre ou sans (--headless)."""
+    screen = None
+    if not args.headless:
+        pygame.display.set_caption("Proto - Feudal Map (rejeu)")
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    res = replay.play(args.replay, screen, realtime=not (args.headless or args.fast))
+    f, u, d = res["frame"], res["update"], res["draw"]
+    print(f"{res['frames']}/{res['recorded']} frames  frame {f['mean']:.2f} ms (p95 {f['p95']:.2f}, p99 {f['p99']:.2f})"
+          f"  update {u['mean']:.2f}  draw {d['mean']:.2f}")
+    for n, want, got in res["diverged"]:
+        print(f"DIVERGENCE frame {n} : {want} attendu, {got} obtenu")
+    return 1 if res["diverged"] else 0
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--record", metavar="FICHIER", help="enregistrer la session (entrées, dt, graines)")
+    ap.add_argument("--replay", metavar="FICHIER", help="rejouer un enregistrement")
+    ap.add_argument("--headless", action="store_true", help="rejeu sans affichage")
+    ap.add_argument("--fast", action="store_true", help="rejeu sans attente (mesure des temps de frame)")
+    args = ap.parse_args()
+
     pygame.init()
+    if args.replay:
+        code = _replay(args)
+        pygame.quit()
+        sys.exit(code)
+
     pygame.display.set_caption("Proto - Feudal Map")
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
+    scheduler = FrameScheduler()
+    sim = FixedStep()
 
     mgr = SceneManager()
-    mgr.push(WorldMap(mgr))
+    # la génération du monde tourne en tâche de fond derrière l'écran de chargement
+    world = WorldMap(mgr)
+    mgr.push(LoadingView(mgr, world))
+    recorder = None
 
     while not mgr.quit:
-        for event in pygame.event.get():
+        # dort tant que la scène courante n'anime rien (réveil sur entrée)
+        events, dt = scheduler.next_frame(mgr.current)
+        if args.record and recorder is None and mgr.current is world:
+            # point de synchro : monde prêt, aucune entrée traitée, accumulateur vide
+            sim = FixedStep()
+            recorder = replay.Recorder(args.record, world, SIM_HZ)
+        handled = []
+        for event in events:
             if event.type == pygame.QUIT:
                 mgr.quit = True
+            elif event.type == pygame.WINDOWEXPOSED:
+                mgr.invalidate()
             else:
                 mgr.handle_event(event)
+                handled.append(event)
 
-        dt = clock.tick(FPS) / 1000.0
-        mgr.update(dt)
-        mgr.draw(screen)
+        # simulation à pas fixe, rendu interpolé entre les deux derniers pas
+        for _ in range(sim.advance(dt)):
+            mgr.update(sim.dt)
+        rects = mgr.draw(screen, sim.alpha)
 
-        pygame.display.flip()
+        # flip complet au changement de scène ; sinon seulement les zones modifiées
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        mgr.end_frame()
+        if recorder:
+            recorder.frame(dt, handled, mgr)
 
+    if recorder:
+        recorder.close(mgr)
+    SAVES.flush()  # sauvegarde en attente écrite avant de quitter
     pygame.quit()
     sys.exit(0)
 
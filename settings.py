@@ -3,9 +3,16 @@ WIDTH  = 1280
 HEIGHT = 720
 FPS    = 60
 
+# --- Simulation (pas fixe, indépendant du rendu) ---
+SIM_HZ        = 60   # pas de simulation par seconde
+MAX_SIM_STEPS = 5    # pas max par frame rendue (au-delà, le retard est abandonné)
+
 # --- World size (agrandi pour mer tout autour) ---
 WORLD_W = 2400
 WORLD_H = 1800
+# Au-delà de ~2800x2800, les grilles monde (collision, A*, distance à la côte) grossissent leur pas
+# pour rester dans leurs budgets de cellules (world_map.*_BUDGET_CELLS) : mémoire bornée, précision
+# de collision réduite d'autant. Le fond de carte, lui, est toujours découpé en tuiles (world_chunks).
 
 # --- Colors (RGB) ---
 COLOR_UI            = (245, 245, 245)
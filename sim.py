@@ -0,0 +1,176 @@
+"""
+Simulation accélérée sans affichage : logique du monde seule (WorldMap.update, King.update,
+combats aléatoires, ouverture des châteaux), aucun draw ni travail de Surface.
+    python sim.py                          # 100 000 pas à dt fixe (1/SIM_HZ)
+    python sim.py --ticks 500000 --seed 3  # autre partie scriptée
+    python sim.py --json                   # état final en JSON (équilibrage, tests automatisés)
+Les entrées viennent d'un pilote scripté (Autopilot) qui clique comme un joueur.
+La sauvegarde du joueur n'est jamais modifiée : le monde tourne dans une copie de data/.
+"""
+import argparse, json, os, random, shutil, tempfile, time
+from pathlib import Path
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # --json : rien d'autre sur la sortie standard
+import pygame
+
+from settings import SIM_HZ
+from game.scene import SceneManager
+from game import world_map, terrain_cache
+from game.world_map import WorldMap
+from game.castle_view import CastleView
+from game.battle_view import BattleView
+from game.save import SAVES
+
+TICKS = 100_000
+DWELL = 0.5         # s de simulation passées dans une scène enfant avant d'en sortir
+P_CASTLE = 0.5      # choix du pilote quand le roi est à l'arrêt : château / port / point libre
+P_PORT = 0.2
+P_VISIT = 0.5       # dans un château : entre dans un bâtiment (assaut, boutique, caserne) plutôt que de ressortir
+
+
+def _click(pos) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(int(pos[0]), int(pos[1])), button=1)
+
+
+def _key(key) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+class Autopilot:
+    """
+    Source d'entrées scriptée : renvoie à chaque pas les événements qu'enverrait un joueur.
+    Carte : vise un château, un port ou un point au hasard dès que le roi s'arrête.
+    Scènes enfants : reste `dwell` s puis sort (victoire au combat, bâtiment visité parfois au château).
+    """
+    def __init__(self, seed: int = 0, dwell: float = DWELL):
+        self.rng = random.Random(seed)
+        self.dwell = dwell
+        self._scene = None
+        self._since = 0.0
+
+    def poll(self, mgr: SceneManager, dt: float) -> list[pygame.event.Event]:
+        scene = mgr.current
+        if scene is not self._scene:
+            self._scene, self._since = scene, 0.0
+        self._since += dt
+        if isinstance(scene, WorldMap):
+            return self._on_map(scene)
+        if self._since < self.dwell:
+            return []
+        self._since = 0.0
+        if isinstance(scene, BattleView):
+            return [_key(pygame.K_v)]
+        if isinstance(scene, CastleView) and self.rng.random() < P_VISIT:
+            b = self.rng.choice([e for e in scene.entities if e.interactive])
+            return [_click(b.rect.center)]
+        return [_key(pygame.K_ESCAPE)]  # château, boutique, caserne
+
+    def _on_map(self, world: WorldMap) -> list[pygame.event.Event]:
+        if world.king.moving:
+            return []  # arrivé au château visé, update l'ouvre dans le même pas
+        r = self.rng.random()
+        if r < P_CASTLE and world.castles:
+            p = self.rng.choice(world.castles).pos
+        elif r < P_CASTLE + P_PORT and world.ports:
+            p = self.rng.choice(world.ports).pos
+        else:
+            k = world.king.pos
+            p = pygame.Vector2(k.x + self.rng.uniform(-400, 400), k.y + self.rng.uniform(-400, 400))
+        return [_click(p - world.cam)]  # coordonnées écran, comme un vrai clic
+
+
+def _data_copy(src: Path, dst: Path):
+    """
+    Copie la sauvegarde et le cache terrain (dérivé : évite de régénérer le monde) ;
+    rien de ce que fait la simulation, y compris dans le cache, n'atteint `src`.
+    """
+    if (src / "world_map.json").exists():
+        shutil.copy2(src / "world_map.json", dst / "world_map.json")
+    terrain_cache.TerrainCache(src / "terrain_cache").copy_to(dst / "terrain_cache")
+
+
+def run(ticks: int, seed: int, dt: float = 1.0 / SIM_HZ, dwell: float = DWELL) -> dict:
+    """Génère le monde puis avance `ticks` pas de `dt` ; renvoie statistiques et état final."""
+    mgr = SceneManager(headless=True)
+    pilot = Autopilot(seed, dwell)
+
+    t0 = time.perf_counter()
+    world = WorldMap(mgr)
+    mgr.push(world)  # génération synchrone (on_enter)
+    setup = time.perf_counter() - t0
+    # après la génération, qui ne réensemence `random` (SEED + 2025) qu'en l'absence de cache terrain
+    random.seed(seed)  # combats aléatoires de WorldMap
+
+    counts = {"CastleView": 0, "BattleView": 0, "ShopView": 0, "BarracksView": 0, "mode_changes": 0}
+    distance, mode, scene = 0.0, world.king.mode, mgr.current
+    done = 0
+    t0 = time.perf_counter()
+    while done < ticks and not mgr.quit:
+        for event in pilot.poll(mgr, dt):
+            mgr.handle_event(event)
+        prev = world.king.pos.copy()
+        mgr.update(dt)
+        mgr.end_frame()
+        done += 1
+        distance += prev.distance_to(world.king.pos)
+        if mgr.current is not scene:
+            scene = mgr.current
+            name = type(scene).__name__
+            if name in counts and len(mgr.stack) > 1:  # entrée dans une scène (pas un retour)
+                counts[name] += 1
+        if world.king.mode != mode:
+            mode = world.king.mode
+            counts["mode_changes"] += 1
+    wall = time.perf_counter() - t0
+
+    king = world.king
+    return {
+        "ticks": done,
+        "sim_seconds": done * dt,
+        "wall_seconds": wall,
+        "ticks_per_second": done / wall if wall > 0 else 0.0,
+        "setup_seconds": setup,
+        "events": counts,
+        "distance": round(distance, 1),
+        "king": {"x": round(king.pos.x, 1), "y": round(king.pos.y, 1), "mode": king.mode,
+                 "resources": dict(king.resources), "equipment": dict(king.equipment), "army": dict(king.army)},
+        "owners": {o: sum(c.owner == o for c in world.castles) for o in sorted({c.owner for c in world.castles})},
+        "scenes": [type(s).__name__ for s in mgr.stack],
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python sim.py", description=__doc__.splitlines()[1])
+    ap.add_argument("--ticks", type=int, default=TICKS, help="pas de simulation")
+    ap.add_argument("--seed", type=int, default=0, help="graine du pilote et des événements aléatoires")
+    ap.add_argument("--hz", type=float, default=SIM_HZ, help="pas par seconde de jeu (dt = 1/hz)")
+    ap.add_argument("--dwell", type=float, default=DWELL, help="s passées dans chaque scène enfant")
+    ap.add_argument("--data", type=Path, default=world_map.DATA_DIR, help="données de départ (copiées)")
+    ap.add_argument("--json", action="store_true", help="résultat en JSON sur la sortie standard")
+    args = ap.parse_args(argv)
+
+    pygame.init()
+    with tempfile.TemporaryDirectory() as tmp:
+        _data_copy(args.data, Path(tmp))
+        world_map.DATA_DIR = Path(tmp)
+        result = run(args.ticks, args.seed, 1.0 / args.hz, args.dwell)
+        SAVES.flush()  # écritures de la copie terminées avant sa suppression
+    pygame.quit()
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0
+    print(f"{result['ticks']} pas ({result['sim_seconds']:.0f} s de jeu) en {result['wall_seconds']:.2f} s"
+          f" -> {result['ticks_per_second']:.0f} pas/s   (génération {result['setup_seconds']:.2f} s)")
+    ev = result["events"]
+    print(f"châteaux ouverts {ev['CastleView']}  combats {ev['BattleView']}  boutique {ev['ShopView']}"
+          f"  caserne {ev['BarracksView']}  embarquements/débarquements {ev['mode_changes']}")
+    k = result["king"]
+    print(f"roi ({k['x']:.0f}, {k['y']:.0f}) {k['mode']}  parcouru {result['distance']:.0f} px"
+          f"  ressources {k['resources']}  armée {k['army']}")
+    print(f"châteaux {result['owners']}  scènes {' > '.join(result['scenes'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
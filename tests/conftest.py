@@ -0,0 +1,35 @@
+import os, sys
+from pathlib import Path
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def _terrain_cache(tmp_path_factory):
+    """Cache terrain de la session : copie de celui du dépôt s'il existe, rempli au premier monde sinon."""
+    from game import terrain_cache
+    root = tmp_path_factory.mktemp("terrain_cache")
+    return terrain_cache.TerrainCache(ROOT / "data" / "terrain_cache").copy_to(root).root
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch, _terrain_cache):
+    """data/ isolé : sauvegarde vide, cache terrain partagé par la session (jamais celui du dépôt)."""
+    from game import world_map
+    d = tmp_path / "data"
+    d.mkdir()
+    (d / "terrain_cache").symlink_to(_terrain_cache, target_is_directory=True)
+    monkeypatch.setattr(world_map, "DATA_DIR", d)
+    return d
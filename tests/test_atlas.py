@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+import pygame
+
+from game import entities
+from game.atlas import SpriteAtlas
+from game.entities import Castle, King, Port
+
+
+def _background():
+    """Fond opaque non uniforme : un pixel de sprite mal placé ou transparent à tort se voit."""
+    rng = np.random.default_rng(7)
+    surf = pygame.Surface((160, 160))
+    pygame.surfarray.blit_array(surf, rng.integers(0, 256, (160, 160, 3), dtype=np.uint8))
+    return surf
+
+
+def _same(paint, sprite, pos):
+    """Peinture directe d'origine et blit de la variante de l'atlas, au même point écran."""
+    bg = _background()
+    direct, atlased = bg.copy(), bg.copy()
+    paint(direct, pygame.Vector2(pos))
+    img, (ax, ay) = sprite
+    atlased.blit(img, (int(pos[0]) - ax, int(pos[1]) - ay))
+    return (pygame.surfarray.array3d(direct) == pygame.surfarray.array3d(atlased)).all()
+
+
+def test_sprites_match_direct_painting(monkeypatch):
+    # petites pages : plusieurs étagères et plusieurs pages sont utilisées
+    monkeypatch.setattr(entities, "ATLAS", SpriteAtlas(page_size=128))
+    for owner in ("enemy", "player", "enemy"):
+        for r in (14, 18, 24):
+            c = Castle("Test", 0, 0, owner, radius=r)
+            assert _same(c._paint, c.sprite(), (80, 80))
+    p = Port("Port", 0, 0)
+    assert _same(p._paint, p.sprite(), (80, 80))
+
+    king = King(0, 0)
+    for mode in ("land", "boat"):
+        king.mode = mode
+        for ticks in range(0, 2100, 150):  # une période de pulsation
+            monkeypatch.setattr(pygame.time, "get_ticks", lambda ticks=ticks: ticks)
+            pulse = 2 + int(2 * (1 + math.sin(ticks * 0.003)))
+            paint = lambda surf, sp: King._paint(surf, sp, pulse, mode, entities.COLOR_KING)
+            assert _same(paint, king.sprite(), (80, 80))
+    assert len(entities.ATLAS.pages) > 1
+
+
+def test_owner_flip_renders_only_new_variant(monkeypatch):
+    monkeypatch.setattr(entities, "ATLAS", SpriteAtlas())
+    c = Castle("Test", 0, 0, "enemy")
+    first = c.sprite()
+    c.owner = "player"
+    c.sprite()
+    assert len(entities.ATLAS) == 2
+    c.owner = "enemy"
+    assert c.sprite() is first
@@ -0,0 +1,46 @@
+import numpy as np
+import pygame
+
+from bench.building_surfaces import COLORS, SIZES, _gradient_rows, _shadow_rows
+from game import castle_view
+
+EDGE_SIZES = [(1, 1), (1, 7), (9, 1), (33, 17), (255, 3)]
+
+
+def _background(size):
+    rng = np.random.default_rng(3)
+    surf = pygame.Surface(size)
+    pygame.surfarray.blit_array(surf, rng.integers(0, 256, (*size, 3), dtype=np.uint8))
+    return surf
+
+
+def _pixels(surf):
+    return pygame.image.tobytes(surf, "RGB")
+
+
+def test_shadow_matches_row_by_row():
+    for w, h in SIZES + EDGE_SIZES:
+        w, h = w + int(w * 0.12), max(1, int(h * 0.25) + int(h * 0.18))  # tailles d'ombre des bâtiments
+        a, b = _background((w + 4, h + 4)), _background((w + 4, h + 4))
+        a.blit(_shadow_rows(w, h), (2, 2))
+        b.blit(castle_view._shadow_surface(w, h), (2, 2))
+        assert _pixels(a) == _pixels(b), (w, h)
+
+
+def test_gradient_matches_row_by_row():
+    for w, h in SIZES + EDGE_SIZES:
+        for base, dark in (COLORS, ((255, 255, 255), (0, 0, 0)), ((12, 200, 77), (240, 3, 129))):
+            rect = pygame.Rect(2, 2, w, h)
+            a, b = _background((w + 5, h + 4)), _background((w + 5, h + 4))
+            _gradient_rows(a, rect, base, dark)
+            b.blit(castle_view._gradient_surface(w + 1, h, base, dark), rect.topleft)
+            assert _pixels(a) == _pixels(b), (w, h, base, dark)
+
+
+def test_surface_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(castle_view, "SURFACE_BUDGET_BYTES", 64 * 1024)
+    for w in range(40, 200, 8):
+        castle_view._shadow_surface(w, 60)
+    total = sum(s.get_pitch() * s.get_height() for s in castle_view._surfaces.values())
+    assert total == castle_view._surfaces_bytes <= 64 * 1024
+    assert castle_view._shadow_surface(192, 60) is castle_view._shadow_surface(192, 60)
@@ -0,0 +1,35 @@
+import numpy as np
+import pygame
+
+from game.world_map import LandOverrides
+
+W, H = 301, 203  # largeur non multiple de 8 : dernier octet partiel
+
+
+def _reference(polys):
+    """Rasterisation d'origine : tous les polygones sur une surface pleine taille."""
+    full = pygame.Surface((W, H), 0, 8)
+    for pts in polys:
+        pygame.draw.polygon(full, 1, pts)
+    return np.packbits(pygame.surfarray.array2d(full).T != 0, axis=1)
+
+
+def test_polygons_match_full_world_rasterization():
+    rng = np.random.default_rng(5)
+    polys = []
+    for _ in range(40):  # éloignés, chevauchants, débordant du monde
+        cx, cy = rng.integers(-20, W + 20), rng.integers(-20, H + 20)
+        polys.append([(int(cx + dx), int(cy + dy)) for dx, dy in rng.integers(-25, 26, (6, 2))])
+    lo = LandOverrides(W, H)
+    lo.add_polygons(polys[:20])
+    for pts in polys[20:]:
+        lo.add_polygon(pts)
+    assert (lo.bits == _reference(polys)).all()
+
+    xs, ys = rng.integers(-5, W + 5, 500), rng.integers(-5, H + 5, 500)
+    ref = pygame.Surface((W, H), 0, 8)
+    for pts in polys:
+        pygame.draw.polygon(ref, 1, pts)
+    expected = [0 <= x < W and 0 <= y < H and ref.get_at_mapped((int(x), int(y))) != 0 for x, y in zip(xs, ys)]
+    assert lo.is_land_many(xs, ys).tolist() == expected
+    assert [lo.is_land_here(x, y) for x, y in zip(xs, ys)] == expected
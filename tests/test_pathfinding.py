@@ -0,0 +1,33 @@
+import numpy as np
+
+from game.pathfinding import NavGrid
+
+C = 16
+
+
+def _grid():
+    """10x10 cellules : terre sur les colonnes 0-4, eau au-delà."""
+    land = np.zeros((10, 10), bool)
+    land[:, :5] = True
+    return NavGrid(10 * C, 10 * C, {"land": land, "boat": ~land}, C)
+
+
+def test_reachable_goal_is_exact():
+    nav = _grid()
+    path = nav.find_path((8, 8), (70, 150), "land")
+    assert path[-1] == (70.0, 150.0)
+
+
+def test_goal_next_to_shore_is_kept():
+    nav = _grid()
+    goal = (5 * C + 3, 40)  # première cellule d'eau, contre la côte (port)
+    assert nav.find_path((8, 8), goal, "land")[-1] == (float(goal[0]), 40.0)
+
+
+def test_far_goal_stops_at_snapped_cell():
+    nav = _grid()
+    path = nav.find_path((8, 8), (8 * C + 8, 40), "land")
+    end = path[-1]
+    assert end == nav._center(nav._cell_of(*end))
+    assert nav._walk["land"][nav._cell_of(*end)]
+    assert all(nav._walk["land"][nav._cell_of(*p)] for p in path)
@@ -0,0 +1,49 @@
+import pygame
+
+from game.profiler import Profiler
+from game.scene import Scene, SceneManager
+
+
+class _Static(Scene):
+    """Repeint tout au premier draw, puis annonce qu'aucun pixel n'a changé."""
+    def draw(self, surface):
+        if self._redraw:
+            self._redraw = False
+            surface.fill((90, 140, 200))
+            pygame.draw.line(surface, (250, 250, 250), (0, 0), surface.get_size(), 3)
+            return None
+        return []
+
+
+def _manager():
+    mgr = SceneManager()
+    mgr.profiler = Profiler()
+    mgr.profiler.toggle()  # overlay visible
+    mgr.push(_Static(mgr))
+    return mgr
+
+
+def test_overlay_panel_is_stable_on_static_frames():
+    mgr = _manager()
+    surface = pygame.Surface((640, 480))
+    for _ in range(3):  # quelques frames pour remplir le graphe
+        mgr.draw(surface)
+        mgr.end_frame()
+    frames = []
+    for _ in range(2):  # mêmes mesures affichées : le panneau doit être identique
+        rects = mgr.draw(surface)
+        frames.append(pygame.image.tobytes(surface, "RGB"))
+    assert rects and frames[0] == frames[1]
+
+
+def test_overlay_matches_full_redraw():
+    mgr = _manager()
+    surface = pygame.Surface((640, 480))
+    for _ in range(4):
+        mgr.draw(surface)
+        mgr.end_frame()
+    mgr.draw(surface)
+    mgr.current.invalidate()
+    full = surface.copy()
+    mgr.draw(full)  # même frame, scène entièrement repeinte
+    assert pygame.image.tobytes(surface, "RGB") == pygame.image.tobytes(full, "RGB")
@@ -0,0 +1,93 @@
+import pygame
+
+from game import replay
+from game.castle_view import CastleView
+from game.save import SAVES
+from game.scene import SceneManager
+from game.scheduler import FixedStep
+from game.shop_view import ShopView
+from game.world_map import WorldMap
+from settings import SIM_HZ
+
+
+def _click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def _escape():
+    return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, scancode=0, unicode="")
+
+
+def _record(path, frames=400):
+    """Château -> boutique -> achat -> ESC ESC, avec des dt irréguliers comme Clock.tick."""
+    mgr = SceneManager(headless=True)
+    world = WorldMap(mgr)
+    mgr.push(world)
+    castle = world.castles[0]
+    world.king.pos.update(castle.pos.x + 6, castle.pos.y)
+    rec = replay.Recorder(path, world, SIM_HZ, seed=1234)
+    sim = FixedStep()
+    step = "castle"
+    for n in range(frames):
+        events = []
+        cur = mgr.current
+        if step == "castle" and cur is world and n > 2:
+            events, step = [_click(tuple(map(int, castle.pos - world.cam)))], "shop"
+        elif step == "shop" and isinstance(cur, CastleView):
+            shop = next(e for e in cur.entities if e.kind == "shop")
+            events, step = [_click(shop.rect.center)], "buy"
+        elif step == "buy" and isinstance(cur, ShopView):
+            events, step = [_click((70, 140)), _escape()], "leave"
+        elif step == "leave" and isinstance(cur, CastleView):
+            events, step = [_escape()], "done"
+        for ev in events:
+            mgr.handle_event(ev)
+        dt = (16, 17, 33, 8)[n % 4] / 1000.0
+        for _ in range(sim.advance(dt)):
+            mgr.update(sim.dt)
+        rec.frame(dt, events, mgr)
+    rec.close(mgr)
+    SAVES.flush()
+    return world, step
+
+
+def test_round_trip_is_deterministic(data_dir, tmp_path):
+    path = tmp_path / "s.krpl"
+    world, step = _record(path)
+    assert step == "done" and world.king.equipment  # achat effectué, retour sur la carte
+
+    header, frames = replay.load(path)
+    assert len(frames) == 400 and sum(d is not None for *_, d in frames) >= 400 // replay.HASH_EVERY
+    res = replay.play(path, strict=True)
+    assert res["frames"] == 400 and res["diverged"] == []
+
+
+def test_tampered_seed_diverges(data_dir, tmp_path):
+    path = tmp_path / "s.krpl"
+    _record(path, frames=130)
+    header, frames = replay.load(path)
+    raw = path.read_bytes()
+    seed = str(header["seed"]).encode()
+    path.write_bytes(raw.replace(b'"seed":' + seed, b'"seed":' + str(header["seed"] + 1).encode(), 1))
+    assert replay.play(path)["diverged"]
+
+
+def test_replay_leaves_real_save_untouched(data_dir, tmp_path):
+    path = tmp_path / "s.krpl"
+    _record(path)
+    save = data_dir / "world_map.json"
+    before = (save.read_bytes(), save.stat().st_mtime_ns)
+    res = replay.play(path)
+    assert res["diverged"] == []
+    assert (save.read_bytes(), save.stat().st_mtime_ns) == before
+    assert sorted(p.name for p in data_dir.iterdir()) == ["terrain_cache", "world_map.json"]
+
+
+def test_replay_does_not_write_the_real_terrain_cache(data_dir, tmp_path):
+    path = tmp_path / "s.krpl"
+    _record(path, frames=60)
+    cache = data_dir / "terrain_cache"
+    cache.unlink()
+    cache.mkdir()  # cache réel vide : le rejeu génère le monde dans sa copie
+    assert replay.play(path)["diverged"] == []
+    assert list(cache.iterdir()) == []
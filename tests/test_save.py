@@ -0,0 +1,78 @@
+import json, os
+
+from game import save
+from game.save import SaveWriter, write_atomic
+
+
+def test_write_atomic_replaces_without_leftovers(tmp_path):
+    path = tmp_path / "world_map.json"
+    path.write_text("ancien", encoding="utf-8")
+    write_atomic(path, {"king": {"x": 1}})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"king": {"x": 1}}
+    assert os.listdir(tmp_path) == ["world_map.json"]
+
+
+def test_failed_write_keeps_previous_save(tmp_path):
+    path = tmp_path / "world_map.json"
+    write_atomic(path, {"v": 1})
+    try:
+        write_atomic(path, {"v": object()})  # non sérialisable : échec en cours d'écriture
+    except TypeError:
+        pass
+    assert json.loads(path.read_text(encoding="utf-8")) == {"v": 1}
+
+
+def test_requests_are_coalesced_and_flushed(tmp_path):
+    writer = SaveWriter(debounce=60.0)  # aucune écriture avant flush()
+    path = tmp_path / "world_map.json"
+    done = []
+    for v in range(5):
+        writer.request(path, {"v": v}, on_done=lambda v=v: done.append(v))
+    assert not path.exists()
+    assert writer.flush()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"v": 4}
+    assert done == [4]  # seule la demande écrite est confirmée
+    assert writer.stats == {"requests": 5, "writes": 1, "coalesced": 4, "errors": 0}
+
+
+def test_failure_is_not_reported_done(tmp_path, monkeypatch, capsys):
+    def fail(path, data):
+        raise OSError("disque plein")
+    monkeypatch.setattr(save, "write_atomic", fail)
+    writer = SaveWriter(debounce=0.0)
+    done = []
+    writer.request(tmp_path / "world_map.json", {"v": 1}, on_done=lambda: done.append(1))
+    assert writer.flush()
+    assert done == [] and writer.stats["errors"] == 1 and writer.stats["writes"] == 0
+    assert "disque plein" in capsys.readouterr().out
+
+    monkeypatch.setattr(save, "write_atomic", write_atomic)  # nouvel essai : l'appelant redemande tant que rien n'est confirmé
+    writer.request(tmp_path / "world_map.json", {"v": 1}, on_done=lambda: done.append(1))
+    assert writer.flush()
+    assert done == [1] and writer.stats["writes"] == 1
+
+
+def test_world_map_marks_saved_only_after_write(data_dir, monkeypatch):
+    from game.save import SAVES
+    from game.scene import SceneManager
+    from game.world_map import WorldMap
+    mgr = SceneManager(headless=True)
+    world = WorldMap(mgr)
+    mgr.push(world)
+    SAVES.flush()
+    world.castles[0].owner = "player" if world.castles[0].owner != "player" else "enemy"
+    assert world._changed_since_last_save()
+
+    def fail(path, data):
+        raise OSError("lecture seule")
+    monkeypatch.setattr(save, "write_atomic", fail)
+    world._save_layout()
+    assert SAVES.flush()
+    assert world._changed_since_last_save()  # échec : toujours à sauvegarder
+
+    monkeypatch.setattr(save, "write_atomic", write_atomic)
+    world._save_layout()
+    assert SAVES.flush()
+    assert not world._changed_since_last_save()
+    saved = json.loads((data_dir / "world_map.json").read_text(encoding="utf-8"))
+    assert saved["castles"][0]["owner"] == world.castles[0].owner
@@ -0,0 +1,52 @@
+import pygame
+
+from game.entities import King
+from game.scheduler import FixedStep
+
+
+def _run(frame_dts, hz=60, max_steps=5):
+    sim = FixedStep(hz, max_steps)
+    steps = [sim.advance(dt) for dt in frame_dts]
+    return sim, steps
+
+
+def test_steps_follow_elapsed_time():
+    dts = [ms / 1000.0 for ms in (16, 17, 33, 8)] * 60  # 4,44 s à cadence irrégulière
+    sim, steps = _run(dts)
+    assert sum(steps) == int(sum(dts) * 60)  # 266 pas
+    assert 0.0 <= sim.acc < sim.dt and 0.0 <= sim.alpha < 1.0
+    assert sim.dropped == 0.0
+
+
+def test_render_rate_does_not_change_simulation():
+    """Même durée rendue à 30, 60 ou 144 i/s : mêmes pas, même position du roi."""
+    ends = []
+    for fps in (30, 60, 144):
+        sim = FixedStep(60)
+        king = King(0, 0, speed=200)
+        king.move_to(10_000, 0)
+        for _ in range(fps * 2):
+            for _ in range(sim.advance(1.0 / fps)):
+                king.update(sim.dt)
+        ends.append((round(king.pos.x, 6), king.pos.y))
+    assert ends[0] == ends[1] == ends[2]
+
+
+def test_long_frame_is_clamped():
+    sim, steps = _run([2.0], max_steps=5)
+    assert steps == [5]
+    assert abs(sim.dropped - (120 - 5) / 60) < 1e-9
+    assert 0.0 <= sim.acc < sim.dt  # le retard n'est pas reporté sur les frames suivantes
+    assert sim.advance(1 / 60) == 1
+
+
+def test_render_pos_interpolates_between_steps():
+    king = King(100, 50, speed=60)
+    king.move_to(200, 50)
+    king.update(0.5)
+    assert king.render_pos(0.0) == pygame.Vector2(100, 50)
+    assert king.render_pos(1.0) == king.pos == pygame.Vector2(130, 50)
+    assert king.render_pos(0.5) == pygame.Vector2(115, 50)
+    king.pos.update(400, 400)
+    king.snap()
+    assert king.render_pos(0.0) == pygame.Vector2(400, 400)
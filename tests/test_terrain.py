@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+
+from game import terrain
+from game.world_map import SEED
+
+
+# ----- version scalaire d'origine (world_map avant vectorisation), référence exacte -----
+def _hash2(ix, iy, seed):
+    n = (ix * 374761393) ^ (iy * 668265263) ^ (seed * 1442695041)
+    n = (n ^ (n >> 13)) * 1274126177
+    n = n ^ (n >> 16)
+    return (n & 0xFFFFFFFF) / 0xFFFFFFFF
+
+def _smoothstep(t): return t * t * (3 - 2 * t)
+
+def _value_noise(x, y, freq, seed):
+    x *= freq; y *= freq
+    ix, iy = int(x), int(y)
+    fx, fy = x - ix, y - iy
+    v00 = _hash2(ix,   iy,   seed)
+    v10 = _hash2(ix+1, iy,   seed)
+    v01 = _hash2(ix,   iy+1, seed)
+    v11 = _hash2(ix+1, iy+1, seed)
+    ux, uy = _smoothstep(fx), _smoothstep(fy)
+    a = v00 + (v10 - v00) * ux
+    b = v01 + (v11 - v01) * ux
+    return a + (b - a) * uy
+
+def _fbm(x, y, seed):
+    return (
+        0.55 * _value_noise(x, y, 1.2, seed) +
+        0.30 * _value_noise(x, y, 3.1, seed+11) +
+        0.15 * _value_noise(x, y, 6.4, seed+29)
+    )
+
+def _island_mask(nx, ny):
+    r = math.hypot(nx - 0.5, ny - 0.5) / 0.7071
+    return max(0.0, min(1.0, 1.0 - r**1.6))
+
+def _height(nx, ny, seed):
+    v = _fbm(nx, ny, seed)
+    v *= 0.75 + 0.25 * _island_mask(nx, ny)
+    light = 0.08 * (1 - (nx + (1 - ny)) / 2)
+    return max(0.0, min(1.0, v + light))
+
+def _classify(v):
+    if v < 0.35: return 0
+    if v < 0.40: return 1
+    if v < 0.45: return 2
+    if v < 0.75: return 3
+    if v < 0.90: return 4
+    return 5
+
+
+def test_hash_is_bit_exact():
+    ix = np.arange(-50, 50)[None, :]
+    iy = np.array([0, 1, 7, 1000, 2**20, -3])[:, None]
+    for seed in (0, 1, SEED, SEED + 29, 2**31 - 1):
+        expected = [[_hash2(int(x), int(y), seed) for x in ix[0]] for y in iy[:, 0]]
+        assert (terrain.hash2(ix, iy, seed) == np.array(expected)).all()
+
+
+def test_classify_matches_thresholds_at_bounds():
+    eps = np.finfo(np.float64).eps
+    v = np.concatenate([[0.0, 1.0], terrain.CLASS_BOUNDS, terrain.CLASS_BOUNDS - eps,
+                        np.random.default_rng(0).random(1000)])
+    assert terrain.classify(v).tolist() == [_classify(x) for x in v]
+
+
+def test_height_grid_matches_scalar():
+    w, h = 60, 45
+    grid = terrain.height_grid(w, h, SEED)
+    expected = np.array([[_height(x / w, y / h, SEED) for x in range(w)] for y in range(h)])
+    # r**1.6 : pow NumPy et pow Python peuvent différer d'un ulp ; les classes, elles, sont identiques
+    assert np.abs(grid - expected).max() <= 4 * np.finfo(np.float64).eps
+    assert (terrain.classify(grid) == np.vectorize(_classify)(expected)).all()
+
+
+def test_process_pool_bands_match_serial(monkeypatch):
+    monkeypatch.setattr(terrain, "PARALLEL_MIN_CELLS", 0)
+    serial = terrain.sample_terrain(120, 90, SEED, workers=1)
+    pooled = terrain.sample_terrain(120, 90, SEED, workers=2)  # processus lancés en spawn
+    assert (serial[0] == pooled[0]).all() and (serial[1] == pooled[1]).all()